@@ -5,20 +5,13 @@ Unified CLI interface for all order types
 """
 
 import sys
+import atexit
 import argparse
 import logging
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
-
-from config import setup_logging, validate_environment
-from market_orders import place_market_order
-from limit_orders import place_limit_order
-from advanced.stop_limit import place_stop_limit_order
-from advanced.oco import place_oco_order
-from advanced.twap import TWAPExecutor, get_client
-from advanced.grid import GridTrader
+# Command modules are imported inside their execute_* handlers so that
+# --help and argument errors don't pay for loading the Binance SDK
+from src.config import setup_logging, validate_environment, get_client
 
 logger = logging.getLogger(__name__)
 
@@ -98,7 +91,10 @@ For detailed help on each command, use:
     oco_parser.add_argument('quantity', type=float, help='Order quantity')
     oco_parser.add_argument('tp_price', type=float, help='Take-profit price')
     oco_parser.add_argument('sl_price', type=float, help='Stop-loss price')
-    oco_parser.add_argument('sl_limit', type=float, help='Stop-loss limit price')
+    oco_parser.add_argument('sl_limit', type=float, nargs='?',
+                          help='Stop-loss limit price (not needed with --close-position)')
+    oco_parser.add_argument('--close-position', action='store_true',
+                          help='Place position-linked TP/SL market orders instead')
     
     # TWAP strategy
     twap_parser = subparsers.add_parser('twap', help='Execute TWAP strategy')
@@ -110,7 +106,13 @@ For detailed help on each command, use:
     twap_parser.add_argument('--duration', type=float, 
                            help='Duration in minutes')
     twap_parser.add_argument('--interval', type=int, 
-                           help='Interval in seconds')
+                           help='Interval in seconds (0 sends all at once)')
+    twap_parser.add_argument('--batch-size', type=int, default=5,
+                           help='Chunks per request when --interval is 0')
+    twap_parser.add_argument('--yes', action='store_true',
+                           help='Start without the confirmation prompt')
+    twap_parser.add_argument('--on-failure', choices=['ask', 'continue', 'abort'],
+                           default='ask', help='After a failed chunk: ask, continue or abort')
     
     # Grid trading
     grid_parser = subparsers.add_parser('grid', help='Execute grid trading')
@@ -122,23 +124,29 @@ For detailed help on each command, use:
     grid_parser.add_argument('--quantity', type=float, required=True,
                            help='Quantity per grid')
     grid_parser.add_argument('--interval', type=int, default=5,
-                           help='Check interval in seconds')
+                           help='Seconds to wait for a fill before running periodic checks')
+    grid_parser.add_argument('--quiet', action='store_true',
+                           help='Log fills without printing them to the console')
     
     return parser
 
 def execute_market(args):
     """Execute market order"""
+    from src.market_orders import place_market_order
+    
     place_market_order(
-        symbol=args.symbol.upper(),
-        side=args.side.upper(),
+        symbol=args.symbol,
+        side=args.side,
         quantity=args.quantity
     )
 
 def execute_limit(args):
     """Execute limit order"""
+    from src.limit_orders import place_limit_order
+    
     place_limit_order(
-        symbol=args.symbol.upper(),
-        side=args.side.upper(),
+        symbol=args.symbol,
+        side=args.side,
         quantity=args.quantity,
         price=args.price,
         time_in_force=args.tif
@@ -146,9 +154,11 @@ def execute_limit(args):
 
 def execute_stop_limit(args):
     """Execute stop-limit order"""
+    from src.advanced.stop_limit import place_stop_limit_order
+    
     place_stop_limit_order(
-        symbol=args.symbol.upper(),
-        side=args.side.upper(),
+        symbol=args.symbol,
+        side=args.side,
         quantity=args.quantity,
         stop_price=args.stop_price,
         limit_price=args.limit_price,
@@ -157,59 +167,82 @@ def execute_stop_limit(args):
 
 def execute_oco(args):
     """Execute OCO order"""
+    from src.advanced.oco import place_oco_order
+    
     place_oco_order(
-        symbol=args.symbol.upper(),
-        side=args.side.upper(),
+        symbol=args.symbol,
+        side=args.side,
         quantity=args.quantity,
         take_profit_price=args.tp_price,
         stop_loss_price=args.sl_price,
-        stop_limit_price=args.sl_limit
+        stop_limit_price=args.sl_limit,
+        close_position=args.close_position
     )
 
 def execute_twap(args):
     """Execute TWAP strategy"""
+    from src.advanced.twap import TWAPExecutor
+    
     client = get_client()
     
     # Calculate interval if duration is provided
     interval = args.interval
-    if args.duration and not interval:
+    if args.duration and interval is None:
         interval = int((args.duration * 60) / args.chunks)
-    elif not interval:
+    elif interval is None:
         interval = 60
     
     executor = TWAPExecutor(
         client=client,
-        symbol=args.symbol.upper(),
-        side=args.side.upper(),
+        symbol=args.symbol,
+        side=args.side,
         total_quantity=args.quantity,
         num_chunks=args.chunks,
-        interval_seconds=interval
+        interval_seconds=interval,
+        batch_size=args.batch_size,
+        confirm=not args.yes,
+        on_failure=args.on_failure
     )
     
     executor.run()
 
 def execute_grid(args):
     """Execute grid trading"""
+    from src.advanced.grid import GridTrader
+    
+    # Block-buffer console output; the grid loop flushes once per burst of
+    # fills instead of on every line
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    atexit.register(sys.stdout.flush)
+    
     client = get_client()
     
     trader = GridTrader(
         client=client,
-        symbol=args.symbol.upper(),
+        symbol=args.symbol,
         lower_price=args.lower,
         upper_price=args.upper,
         num_grids=args.grids,
-        quantity_per_grid=args.quantity
+        quantity_per_grid=args.quantity,
+        verbose=not args.quiet
     )
     
     trader.run(check_interval=args.interval)
 
+# Subcommand name -> handler
+COMMANDS = {
+    'market': execute_market,
+    'limit': execute_limit,
+    'stop-limit': execute_stop_limit,
+    'oco': execute_oco,
+    'twap': execute_twap,
+    'grid': execute_grid,
+}
+
 def main():
     """Main entry point"""
     try:
-        # Validate environment
-        validate_environment()
-        
-        # Parse arguments
+        # Parse arguments first so --help and usage errors skip env checks
         parser = create_parser()
         args = parser.parse_args()
         
@@ -218,26 +251,27 @@ def main():
             parser.print_help()
             return
         
+        # Normalise symbol/side once; interned since they key the filter/price caches
+        args.symbol = sys.intern(args.symbol.upper())
+        if hasattr(args, 'side'):
+            args.side = sys.intern(args.side.upper())
+        
+        setup_logging()
+        
+        # Validate environment
+        validate_environment()
+        
         # Execute command
         logger.info(f"Executing command: {args.command}")
         
-        if args.command == 'market':
-            execute_market(args)
-        elif args.command == 'limit':
-            execute_limit(args)
-        elif args.command == 'stop-limit':
-            execute_stop_limit(args)
-        elif args.command == 'oco':
-            execute_oco(args)
-        elif args.command == 'twap':
-            execute_twap(args)
-        elif args.command == 'grid':
-            execute_grid(args)
-        else:
+        handler = COMMANDS.get(args.command)
+        if handler is None:
             print(f"Unknown command: {args.command}")
             parser.print_help()
             sys.exit(1)
         
+        handler(args)
+        
         logger.info("Command completed successfully")
         
     except KeyboardInterrupt:
@@ -9,14 +9,17 @@ Version: 1.0.0
 __version__ = '1.0.0'
 __author__ = '[Your Name]'
 
-from . import config
-from . import utils
-from . import market_orders
-from . import limit_orders
+import importlib
 
 __all__ = [
     'config',
     'utils',
     'market_orders',
     'limit_orders',
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Import submodules lazily on first attribute access (PEP 562)"""
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,14 +3,17 @@ Advanced Order Types Module
 Contains advanced trading strategies and order types
 """
 
-from . import stop_limit
-from . import oco
-from . import twap
-from . import grid
+import importlib
 
 __all__ = [
     'stop_limit',
     'oco',
     'twap',
     'grid',
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Import submodules lazily on first attribute access (PEP 562)"""
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,69 @@
+"""
+Grid backtest kernel, with an ahead-of-time build for numba
+
+grid.py imports the compiled ``grid_sim`` extension when it has been built,
+so backtests start without JIT compilation. Otherwise it JIT-compiles
+simulate_grid from this module on first use.
+
+Build the extension next to this file with:
+    python -m src.advanced._grid_sim_aot
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+def simulate_grid(prices, levels, quantity):
+    """
+    Replay a price series through the grid and return realized profit
+    
+    Mirrors GridTrader's live behaviour: buys start below the first price and
+    sells above it, a filled buy places a sell one level up, and a filled
+    sell places a buy one level down and realizes one grid step of profit.
+    
+    Args:
+        prices: Price series (float64 array)
+        levels: Ascending grid prices (float64 array)
+        quantity: Quantity per grid level
+        
+    Returns:
+        float: Realized profit
+    """
+    n = levels.shape[0]
+    
+    # Resting buy and sell orders per level
+    buys = np.zeros(n, np.int64)
+    sells = np.zeros(n, np.int64)
+    for i in range(n):
+        if levels[i] < prices[0]:
+            buys[i] = 1
+        elif levels[i] > prices[0]:
+            sells[i] = 1
+    
+    profit = 0.0
+    for t in range(1, prices.shape[0]):
+        price = prices[t]
+        for i in range(n):
+            if buys[i] and price <= levels[i]:
+                if i + 1 < n:
+                    sells[i + 1] += buys[i]
+                buys[i] = 0
+            elif sells[i] and price >= levels[i]:
+                if i > 0:
+                    buys[i - 1] += sells[i]
+                    profit += (levels[i] - levels[i - 1]) * quantity * sells[i]
+                sells[i] = 0
+    
+    return profit
+
+def build():
+    """Compile simulate_grid into the grid_sim extension module"""
+    from numba.pycc import CC
+    
+    cc = CC('grid_sim')
+    cc.output_dir = str(Path(__file__).parent)
+    cc.export('simulate_grid', 'f8(f8[:], f8[:], f8)')(simulate_grid)
+    cc.compile()
+
+if __name__ == "__main__":
+    build()
@@ -5,29 +5,86 @@ Automated buy-low/sell-high within a price range
 
 import sys
 import time
+import queue
 import logging
+import threading
 import argparse
-from pathlib import Path
-from datetime import datetime
-from typing import List, Dict
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
+import numpy as np
+import ujson
 
+from binance import ThreadedWebsocketManager
 from binance.exceptions import BinanceAPIException
-from config import get_client, setup_logging
-from utils import (
-    validate_symbol, validate_quantity, validate_price,
+from src.config import get_client, setup_logging, HTTP_POOL_MAXSIZE, LISTEN_KEY_KEEPALIVE
+from src.utils import (
+    validate_symbol, validate_quantity, get_symbol_limits,
     check_balance, get_current_price, ValidationError
 )
 
 logger = logging.getLogger(__name__)
 
+# Maximum orders accepted by a single batchOrders request
+BATCH_ORDER_LIMIT = 5
+
+# Maximum order IDs accepted by a single cancel-multiple-orders request
+CANCEL_BATCH_LIMIT = 10
+
+# Concurrent status queries during REST reconciliation; bounded by the
+# client's connection pool so every worker reuses a kept-alive connection
+STATUS_WORKERS = HTTP_POOL_MAXSIZE
+
+# Queued by the user-data stream callback when fills may have been missed
+RECONCILE = object()
+
+# Queued when the listenKey has expired and the streams must be re-opened
+RESUBSCRIBE = object()
+
+# Seconds between REST reconciliations of the open orders. The websocket
+# reconnects without reporting it, so fills in that window never arrive.
+RECONCILE_INTERVAL = 60
+
+@functools.lru_cache(maxsize=1)
+def _load_simulator():
+    """
+    Resolve the backtest kernel on first use
+    
+    The ahead-of-time build and numba are both imported only here, so live
+    trading never pays for loading either.
+    
+    Returns:
+        callable: simulate_grid(prices, levels, quantity) -> realized profit
+    """
+    try:
+        # Ahead-of-time build from _grid_sim_aot.py; no compile on first use
+        from src.advanced.grid_sim import simulate_grid
+        return simulate_grid
+    except ImportError:
+        pass
+    
+    from src.advanced._grid_sim_aot import simulate_grid
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; the simulator then runs as plain Python
+        return simulate_grid
+    return njit(cache=True)(simulate_grid)
+
 class GridTrader:
     """Execute grid trading strategy"""
     
+    __slots__ = (
+        'client', 'symbol', 'lower_price', 'upper_price', 'num_grids',
+        'quantity_per_grid', 'grid_levels', '_tick', '_order_templates',
+        'buy_orders', 'sell_orders',
+        'filled_buys', 'filled_sells', 'profit_realized', 'orders_by_id',
+        'fill_events', 'socket_manager', '_last_price',
+        '_listen_key', '_keepalive_stop', 'verbose',
+    )
+    
     def __init__(self, client, symbol: str, lower_price: float, upper_price: float,
-                 num_grids: int, quantity_per_grid: float):
+                 num_grids: int, quantity_per_grid: float, verbose: bool = True):
         """
         Initialize grid trader
         
@@ -38,6 +95,7 @@ class GridTrader:
             upper_price: Upper bound of price range
             num_grids: Number of grid levels
             quantity_per_grid: Quantity to trade at each level
+            verbose: Print each fill to the console in addition to the log
         """
         self.client = client
         self.symbol = symbol
@@ -45,35 +103,88 @@ class GridTrader:
         self.upper_price = upper_price
         self.num_grids = num_grids
         self.quantity_per_grid = quantity_per_grid
+        self.verbose = verbose
         
         self.grid_levels = []
+        self._tick = None
+        self._order_templates = {}
+        
+        # Open orders keyed by grid level index (position in grid_levels);
+        # at most one order per side rests on a level
         self.buy_orders = {}
         self.sell_orders = {}
         self.filled_buys = []
         self.filled_sells = []
         self.profit_realized = 0.0
         
+        # orderId -> (side, level) for resolving user-data stream fill events
+        self.orders_by_id: Dict[int, Tuple[str, int]] = {}
+        self.fill_events = queue.Queue()
+        self.socket_manager = None
+        self._last_price = None
+        self._listen_key = None
+        self._keepalive_stop = threading.Event()
+        
     def calculate_grid_levels(self):
-        """Calculate grid price levels"""
+        """Calculate grid price levels rounded to the symbol tick size"""
         if self.num_grids < 2:
             raise ValidationError("Need at least 2 grid levels")
         
-        price_step = (self.upper_price - self.lower_price) / (self.num_grids - 1)
+        # Fetch the tick size once instead of validating every level
+        limits = get_symbol_limits(self.client, self.symbol)
+        if limits['tick_size'] is None:
+            raise ValidationError(f"Could not find required filters for {self.symbol}")
+        self._tick = float(limits['tick_size'])
+        precision = max(0, -limits['tick_size'].normalize().as_tuple().exponent)
+        
+        # Step in whole ticks so every level lands on a valid price; the
+        # upper level may fall short of upper_price by the integer remainder
+        first_tick = round(self.lower_price / self._tick)
+        n_ticks = round(self.upper_price / self._tick) - first_tick
+        step = n_ticks // (self.num_grids - 1)
+        
+        if step < 1:
+            raise ValidationError(
+                f"Grid spacing is smaller than tick size {self._tick} for {self.symbol}"
+            )
+        
+        tick_index = first_tick + np.arange(self.num_grids, dtype=np.int64) * step
+        levels = np.round(tick_index * self._tick, precision)
         
-        self.grid_levels = [
-            self.lower_price + (i * price_step)
-            for i in range(self.num_grids)
-        ]
+        if levels[0] < limits['min_price']:
+            raise ValidationError(
+                f"Lower price {levels[0]} is below minimum {limits['min_price']} "
+                f"for {self.symbol}"
+            )
+        
+        if levels[-1] > limits['max_price']:
+            raise ValidationError(
+                f"Upper price {levels[-1]} exceeds maximum {limits['max_price']} "
+                f"for {self.symbol}"
+            )
         
-        # Validate each price
-        self.grid_levels = [
-            validate_price(self.client, self.symbol, price)
-            for price in self.grid_levels
-        ]
+        self.grid_levels = levels.tolist()
+        
+        # Build each level's order parameters once; placement reuses them
+        quantity = str(self.quantity_per_grid)
+        self._order_templates = {
+            side: [
+                {
+                    'symbol': self.symbol,
+                    'side': side,
+                    'type': 'LIMIT',
+                    'timeInForce': 'GTC',
+                    'quantity': quantity,
+                    'price': str(price)
+                }
+                for price in self.grid_levels
+            ]
+            for side in ('BUY', 'SELL')
+        }
         
         logger.info(f"Grid levels calculated: {len(self.grid_levels)} levels")
         logger.debug(f"Grid prices: {self.grid_levels}")
-        
+    
     def validate(self):
         """Validate grid parameters"""
         validate_symbol(self.client, self.symbol)
@@ -89,8 +200,9 @@ class GridTrader:
         # Calculate grid levels
         self.calculate_grid_levels()
         
-        # Check balance
-        current_price = get_current_price(self.client, self.symbol)
+        # Check balance; the mark-price stream keeps this fresh afterwards
+        self._last_price = get_current_price(self.client, self.symbol)
+        current_price = self._last_price
         buy_levels = [p for p in self.grid_levels if p <= current_price]
         
         estimated_cost = len(buy_levels) * self.quantity_per_grid * current_price
@@ -106,164 +218,354 @@ class GridTrader:
         
     def place_initial_orders(self):
         """Place initial grid orders"""
-        current_price = get_current_price(self.client, self.symbol)
+        current_price = self._last_price
         
         logger.info(f"Current price: {current_price}")
         logger.info("Placing initial grid orders...")
         
-        # Place buy orders below current price
-        buy_count = 0
-        for price in self.grid_levels:
-            if price < current_price:
-                try:
-                    order = self.client.futures_create_order(
-                        symbol=self.symbol,
-                        side='BUY',
-                        type='LIMIT',
-                        timeInForce='GTC',
-                        quantity=self.quantity_per_grid,
-                        price=price
-                    )
-                    
-                    self.buy_orders[price] = order
-                    buy_count += 1
-                    logger.info(f"Buy order placed at {price}: OrderID={order['orderId']}")
-                    
-                except BinanceAPIException as e:
-                    logger.error(f"Failed to place buy order at {price}: {e}")
-        
-        # Place sell orders above current price
-        sell_count = 0
-        for price in self.grid_levels:
-            if price > current_price:
-                try:
-                    order = self.client.futures_create_order(
-                        symbol=self.symbol,
-                        side='SELL',
-                        type='LIMIT',
-                        timeInForce='GTC',
-                        quantity=self.quantity_per_grid,
-                        price=price
-                    )
-                    
-                    self.sell_orders[price] = order
-                    sell_count += 1
-                    logger.info(f"Sell order placed at {price}: OrderID={order['orderId']}")
-                    
-                except BinanceAPIException as e:
-                    logger.error(f"Failed to place sell order at {price}: {e}")
+        buy_levels = [i for i, p in enumerate(self.grid_levels) if p < current_price]
+        sell_levels = [i for i, p in enumerate(self.grid_levels) if p > current_price]
+        
+        buy_count = self.place_batch_orders('BUY', buy_levels)
+        sell_count = self.place_batch_orders('SELL', sell_levels)
         
         print(f"\n✓ Initial orders placed:")
         print(f"  Buy orders: {buy_count}")
         print(f"  Sell orders: {sell_count}")
         print(f"  Current price: {current_price}")
         
-    def check_filled_orders(self):
-        """Check for filled orders and replace them"""
-        filled_orders = []
+    def place_batch_orders(self, side: str, levels: List[int]) -> int:
+        """
+        Place grid LIMIT orders through the batch order endpoint
+        
+        Args:
+            side: 'BUY' or 'SELL'
+            levels: Grid level indices to place orders at
+            
+        Returns:
+            int: Number of orders placed
+        """
+        templates = self._order_templates[side]
+        placed = 0
         
-        # Check buy orders
-        for price, order in list(self.buy_orders.items()):
+        for start in range(0, len(levels), BATCH_ORDER_LIMIT):
+            chunk = levels[start:start + BATCH_ORDER_LIMIT]
+            
             try:
-                status = self.client.futures_get_order(
-                    symbol=self.symbol,
-                    orderId=order['orderId']
+                results = self.client.futures_place_batch_order(
+                    batchOrders=ujson.dumps([templates[level] for level in chunk])
                 )
-                
-                if status['status'] == 'FILLED':
-                    filled_orders.append(('BUY', price, order))
-                    del self.buy_orders[price]
-                    self.filled_buys.append(order)
-                    
             except BinanceAPIException as e:
-                logger.error(f"Error checking buy order at {price}: {e}")
+                prices = [self.grid_levels[level] for level in chunk]
+                logger.error(f"Failed to place {side} batch at {prices}: {e}")
+                continue
+            
+            # Each entry is either an order or a {code, msg} error
+            for level, result in zip(chunk, results):
+                price = self.grid_levels[level]
+                if 'orderId' not in result:
+                    logger.error(
+                        f"Failed to place {side} order at {price}: {result.get('msg')}"
+                    )
+                    continue
+                
+                self._track_order(side, level, result)
+                placed += 1
+                logger.info(f"{side} order placed at {price}: OrderID={result['orderId']}")
+        
+        return placed
+    
+    def start_streams(self):
+        """
+        Subscribe to the user-data and mark-price streams
+        
+        Both streams share one combined connection. The listenKey is owned
+        here rather than by the socket manager so it can be kept alive with a
+        single REST call every LISTEN_KEY_KEEPALIVE seconds.
+        """
+        self._listen_key = self.client.futures_stream_get_listen_key()
+        
+        self.socket_manager = ThreadedWebsocketManager(
+            api_key=self.client.API_KEY,
+            api_secret=self.client.API_SECRET,
+            testnet=self.client.testnet
+        )
+        self.socket_manager.start()
+        self.socket_manager.start_futures_multiplex_socket(
+            callback=self.on_stream_message,
+            streams=[self._listen_key, f"{self.symbol.lower()}@markPrice@1s"]
+        )
+        
+        self._keepalive_stop.clear()
+        threading.Thread(
+            target=self._keepalive_listen_key, name='listen-key-keepalive', daemon=True
+        ).start()
         
-        # Check sell orders
-        for price, order in list(self.sell_orders.items()):
+        logger.info("User-data and mark-price streams started")
+    
+    def stop_streams(self):
+        """Stop the websocket streams and release the listenKey"""
+        self._keepalive_stop.set()
+        
+        if self.socket_manager:
+            self.socket_manager.stop()
+            self.socket_manager = None
+            logger.info("Websocket streams stopped")
+        
+        if self._listen_key:
             try:
-                status = self.client.futures_get_order(
-                    symbol=self.symbol,
-                    orderId=order['orderId']
-                )
-                
-                if status['status'] == 'FILLED':
-                    filled_orders.append(('SELL', price, order))
-                    del self.sell_orders[price]
-                    self.filled_sells.append(order)
-                    
+                self.client.futures_stream_close(listenKey=self._listen_key)
             except BinanceAPIException as e:
-                logger.error(f"Error checking sell order at {price}: {e}")
+                logger.warning(f"Failed to close listenKey: {e}")
+            self._listen_key = None
+    
+    def _keepalive_listen_key(self):
+        """Extend the listenKey's validity until stop_streams() is called"""
+        while not self._keepalive_stop.wait(LISTEN_KEY_KEEPALIVE):
+            try:
+                self.client.futures_stream_keepalive(listenKey=self._listen_key)
+                logger.debug("listenKey keepalive sent")
+            except Exception as e:
+                logger.warning(f"listenKey keepalive failed: {e}")
+    
+    def on_stream_message(self, msg: dict):
+        """
+        Route a combined-stream message to its handler (runs on the websocket thread)
+        
+        Args:
+            msg: Combined-stream message or connection error
+        """
+        data = msg.get('data', msg)
+        
+        if data.get('e') == 'markPriceUpdate':
+            self.on_mark_price(data)
+        else:
+            self.on_user_event(data)
+    
+    def on_mark_price(self, event: dict):
+        """
+        Cache the latest mark price (runs on the websocket thread)
+        
+        Args:
+            event: markPriceUpdate event
+        """
+        self._last_price = float(event['p'])
+    
+    def on_user_event(self, msg: dict):
+        """
+        Handle a user-data stream message (runs on the websocket thread)
+        
+        Args:
+            msg: Raw user-data event
+        """
+        event_type = msg.get('e')
+        
+        if event_type == 'ORDER_TRADE_UPDATE':
+            order = msg['o']
+            if order['s'] == self.symbol and order['X'] == 'FILLED':
+                self.fill_events.put(order['i'])
+                
+        elif event_type == 'listenKeyExpired':
+            # No further fills will arrive on this key
+            logger.error("User-data listenKey expired")
+            self.fill_events.put(RESUBSCRIBE)
+                
+        elif event_type == 'error':
+            # Fills may have been missed while the stream was down
+            logger.warning(f"User-data stream error: {msg.get('m')}")
+            self.fill_events.put(RECONCILE)
+    
+    def process_fill(self, order_id: int):
+        """
+        Process a fill reported by the user-data stream
+        
+        Args:
+            order_id: ID of the filled order
+        """
+        if order_id not in self.orders_by_id:
+            return
+        
+        side, level, order = self._record_fill(order_id)
+        self.handle_filled_order(side, level, order)
+    
+    def _track_order(self, side: str, level: int, order: dict):
+        """
+        Register an open order in its side's book and the orderId index
+        
+        The level must be free on that side; handle_filled_order checks this
+        before placing a counterpart.
+        
+        Args:
+            side: 'BUY' or 'SELL'
+            level: Grid level index of the order
+            order: Order as returned at placement
+        """
+        orders = self.buy_orders if side == 'BUY' else self.sell_orders
+        orders[level] = order
+        self.orders_by_id[order['orderId']] = (side, level)
+    
+    def _record_fill(self, order_id: int) -> Tuple[str, int, dict]:
+        """
+        Move a filled order out of the open books into the fill history
+        
+        Args:
+            order_id: ID of the filled order; must be in orders_by_id
+            
+        Returns:
+            tuple: (side, level, filled order)
+        """
+        side, level = self.orders_by_id.pop(order_id)
+        if side == 'BUY':
+            order = self.buy_orders.pop(level)
+            self.filled_buys.append(order)
+        else:
+            order = self.sell_orders.pop(level)
+            self.filled_sells.append(order)
+        
+        return side, level, order
+    
+    def fetch_order_status(self, side: str, level: int, order: dict) -> Optional[dict]:
+        """
+        Fetch an order's current status over REST
+        
+        Args:
+            side: 'BUY' or 'SELL'
+            level: Grid level index of the order
+            order: Order as returned at placement
+            
+        Returns:
+            dict: Order status, or None if the request failed
+        """
+        try:
+            return self.client.futures_get_order(
+                symbol=self.symbol,
+                orderId=order['orderId']
+            )
+        except BinanceAPIException as e:
+            logger.error(
+                "Error checking %s order at %s: %s", side.lower(), self.grid_levels[level], e
+            )
+            return None
+    
+    def check_filled_orders(self):
+        """Check for filled orders over REST and replace them"""
+        open_orders = [('BUY', level, order) for level, order in self.buy_orders.items()]
+        open_orders += [('SELL', level, order) for level, order in self.sell_orders.items()]
+        
+        if not open_orders:
+            return 0
+        
+        # Query all orders concurrently rather than one round-trip at a time
+        with ThreadPoolExecutor(max_workers=STATUS_WORKERS) as executor:
+            statuses = list(executor.map(lambda o: self.fetch_order_status(*o), open_orders))
+        
+        filled_orders = []
+        for (side, level, order), status in zip(open_orders, statuses):
+            if status is None or status['status'] != 'FILLED':
+                continue
+            
+            filled_orders.append(self._record_fill(order['orderId']))
         
         # Replace filled orders
-        for side, price, filled_order in filled_orders:
-            self.handle_filled_order(side, price, filled_order)
+        for side, level, filled_order in filled_orders:
+            self.handle_filled_order(side, level, filled_order)
         
         return len(filled_orders)
     
-    def handle_filled_order(self, side: str, price: float, order: dict):
+    def handle_filled_order(self, side: str, level: int, order: dict):
         """
         Handle filled order and place counterpart order
         
         Args:
             side: 'BUY' or 'SELL'
-            price: Fill price
+            level: Grid level index of the filled order
             order: Filled order details
         """
-        logger.info(f"{side} order filled at {price}")
-        print(f"\n✓ {side} order filled at {price}")
+        price = self.grid_levels[level]
+        logger.info("%s order filled at %s", side, price)
+        if self.verbose:
+            print(f"\n✓ {side} order filled at {price}")
         
         try:
             if side == 'BUY':
                 # Buy filled, place sell order at next grid level above
-                sell_price = min([p for p in self.grid_levels if p > price])
+                sell_level = level + 1
+                if sell_level >= len(self.grid_levels):
+                    logger.warning("No grid level above %s, SELL order not placed", price)
+                    return
+                sell_price = self.grid_levels[sell_level]
+                if sell_level in self.sell_orders:
+                    # The resting SELL there already closes this quantity
+                    logger.info("SELL order already open at %s, not placing another", sell_price)
+                    return
                 
                 sell_order = self.client.futures_create_order(
-                    symbol=self.symbol,
-                    side='SELL',
-                    type='LIMIT',
-                    timeInForce='GTC',
-                    quantity=self.quantity_per_grid,
-                    price=sell_price
+                    **self._order_templates['SELL'][sell_level]
                 )
                 
-                self.sell_orders[sell_price] = sell_order
+                self._track_order('SELL', sell_level, sell_order)
                 
-                logger.info(f"Placed SELL order at {sell_price}")
-                print(f"  → Placed SELL order at {sell_price}")
+                logger.info("Placed SELL order at %s", sell_price)
+                if self.verbose:
+                    print(f"  → Placed SELL order at {sell_price}")
                 
             else:  # SELL
                 # Sell filled, place buy order at next grid level below
-                buy_price = max([p for p in self.grid_levels if p < price])
+                buy_level = level - 1
+                if buy_level < 0:
+                    logger.warning("No grid level below %s, BUY order not placed", price)
+                    return
+                buy_price = self.grid_levels[buy_level]
+                if buy_level in self.buy_orders:
+                    # The resting BUY there already closes this quantity
+                    logger.info("BUY order already open at %s, not placing another", buy_price)
+                    return
                 
                 buy_order = self.client.futures_create_order(
-                    symbol=self.symbol,
-                    side='BUY',
-                    type='LIMIT',
-                    timeInForce='GTC',
-                    quantity=self.quantity_per_grid,
-                    price=buy_price
+                    **self._order_templates['BUY'][buy_level]
                 )
                 
-                self.buy_orders[buy_price] = buy_order
+                self._track_order('BUY', buy_level, buy_order)
                 
                 # Calculate profit
                 profit = (price - buy_price) * self.quantity_per_grid
                 self.profit_realized += profit
                 
-                logger.info(f"Placed BUY order at {buy_price}, Profit: {profit:.2f}")
-                print(f"  → Placed BUY order at {buy_price}")
-                print(f"  💰 Profit: {profit:.2f} USDT")
+                logger.info("Placed BUY order at %s, Profit: %.2f", buy_price, profit)
+                if self.verbose:
+                    print(f"  → Placed BUY order at {buy_price}")
+                    print(f"  💰 Profit: {profit:.2f} USDT")
                 
         except BinanceAPIException as e:
-            logger.error(f"Failed to place counterpart order: {e}")
-            print(f"  ✗ Failed to place counterpart order: {e}")
+            logger.error("Failed to place counterpart order: %s", e)
+            if self.verbose:
+                print(f"  ✗ Failed to place counterpart order: {e}")
+    
+    def simulate(self, prices) -> float:
+        """
+        Backtest the calculated grid against a historical price series
+        
+        Args:
+            prices: Sequence of prices, oldest first
+            
+        Returns:
+            float: Realized profit in USDT
+        """
+        if not self.grid_levels:
+            raise ValidationError("Grid levels not calculated; call validate() first")
+        
+        return float(_load_simulator()(
+            np.ascontiguousarray(prices, dtype=np.float64),
+            np.asarray(self.grid_levels, dtype=np.float64),
+            float(self.quantity_per_grid)
+        ))
     
     def display_status(self):
         """Display current grid status"""
-        current_price = get_current_price(self.client, self.symbol)
+        current_price = self._last_price
         
         print("\n" + "=" * 60)
-        print(f"Grid Status - {datetime.now().strftime('%H:%M:%S')}")
+        print(f"Grid Status - {time.strftime('%H:%M:%S')}")
         print("=" * 60)
         print(f"Symbol: {self.symbol}")
         print(f"Current Price: {current_price}")
@@ -276,13 +578,19 @@ class GridTrader:
         print(f"  Sells filled: {len(self.filled_sells)}")
         print(f"  Realized profit: {self.profit_realized:.2f} USDT")
         print("=" * 60)
+        sys.stdout.flush()
     
     def run(self, check_interval: int = 5):
         """
         Run grid trading strategy
         
+        Fills arrive over the user-data stream; every RECONCILE_INTERVAL
+        seconds the open orders are also checked over REST to catch fills the
+        stream missed.
+        
         Args:
-            check_interval: Seconds between order checks
+            check_interval: Seconds to wait for a fill event before running
+                the periodic status and reconciliation checks
         """
         try:
             # Validation
@@ -309,25 +617,47 @@ class GridTrader:
                 print(f"  Level {i:2d}: {price}")
             print("=" * 60)
             
+            # Subscribe before placing orders so no fill is missed and the
+            # cached price stays current while waiting for confirmation
+            self.start_streams()
+            
             input("\nPress ENTER to start grid trading (or Ctrl+C to cancel)...")
             
             # Place initial orders
             self.place_initial_orders()
             
             print("\n🔄 Grid trading active. Press Ctrl+C to stop.")
-            print(f"   Checking orders every {check_interval} seconds...\n")
+            print("   Listening for fills on the user-data stream...\n")
+            sys.stdout.flush()
             
             # Main loop
-            iteration = 0
+            last_status = last_reconcile = time.monotonic()
             while True:
-                time.sleep(check_interval)
-                iteration += 1
+                try:
+                    event = self.fill_events.get(timeout=check_interval)
+                except queue.Empty:
+                    event = None
+                
+                if event is RESUBSCRIBE:
+                    self.stop_streams()
+                    self.start_streams()
+                    event = RECONCILE
+                elif event is not None and event is not RECONCILE:
+                    self.process_fill(event)
                 
-                filled_count = self.check_filled_orders()
+                # Reconcile on request, and periodically as a safety net
+                if event is RECONCILE or time.monotonic() - last_reconcile >= RECONCILE_INTERVAL:
+                    self.check_filled_orders()
+                    last_reconcile = time.monotonic()
+                
+                # Flush console output once per burst of fills
+                if self.fill_events.empty():
+                    sys.stdout.flush()
                 
                 # Display status periodically
-                if iteration % 12 == 0:  # Every minute with 5s interval
+                if time.monotonic() - last_status >= 60:
                     self.display_status()
+                    last_status = time.monotonic()
                 
         except KeyboardInterrupt:
             logger.info("Grid trading stopped by user")
@@ -341,34 +671,49 @@ class GridTrader:
             raise
     
     def cleanup(self):
-        """Cancel all active orders"""
+        """
+        Cancel the grid's active orders
+        
+        Orders are cancelled by ID through the batch endpoint, up to
+        CANCEL_BATCH_LIMIT per request, so other open orders on the symbol
+        (such as OCO or stop-limit protection) are left in place.
+        """
+        self.stop_streams()
+        
         print("\n🧹 Cancelling active orders...")
         
-        cancelled = 0
+        order_ids = list(self.orders_by_id)
+        if not order_ids:
+            print("✓ No grid orders to cancel")
+            self.display_status()
+            return
         
-        # Cancel buy orders
-        for price, order in self.buy_orders.items():
-            try:
-                self.client.futures_cancel_order(
-                    symbol=self.symbol,
-                    orderId=order['orderId']
-                )
-                cancelled += 1
-                logger.info(f"Cancelled buy order at {price}")
-            except Exception as e:
-                logger.error(f"Failed to cancel buy order at {price}: {e}")
+        for order_id, (side, level) in self.orders_by_id.items():
+            logger.info("Cancelling %s order at %s", side.lower(), self.grid_levels[level])
         
-        # Cancel sell orders
-        for price, order in self.sell_orders.items():
+        cancelled = 0
+        for start in range(0, len(order_ids), CANCEL_BATCH_LIMIT):
+            chunk = order_ids[start:start + CANCEL_BATCH_LIMIT]
+            
             try:
-                self.client.futures_cancel_order(
-                    symbol=self.symbol,
-                    orderId=order['orderId']
+                results = self.client.futures_cancel_orders(
+                    symbol=self.symbol, orderIdList=ujson.dumps(chunk)
                 )
-                cancelled += 1
-                logger.info(f"Cancelled sell order at {price}")
             except Exception as e:
-                logger.error(f"Failed to cancel sell order at {price}: {e}")
+                logger.error("Failed to cancel orders %s: %s", chunk, e)
+                print(f"✗ Failed to cancel {len(chunk)} orders: {e}")
+                continue
+            
+            # Each entry is either the cancelled order or a {code, msg} error
+            for order_id, result in zip(chunk, results):
+                if 'orderId' not in result:
+                    logger.error("Failed to cancel order %s: %s", order_id, result.get('msg'))
+                    continue
+                
+                side, level = self.orders_by_id.pop(order_id)
+                orders = self.buy_orders if side == 'BUY' else self.sell_orders
+                orders.pop(level, None)
+                cancelled += 1
         
         print(f"✓ Cancelled {cancelled} orders")
         self.display_status()
@@ -381,10 +726,10 @@ def main():
         epilog="""
 Examples:
   # Grid trade BTC between $48k-$52k with 10 levels
-  python grid.py BTCUSDT 48000 52000 --grids 10 --quantity 0.01
+  python -m src.advanced.grid BTCUSDT 48000 52000 --grids 10 --quantity 0.01
 
   # Grid trade ETH with 5 levels
-  python grid.py ETHUSDT 2800 3200 --grids 5 --quantity 0.1
+  python -m src.advanced.grid ETHUSDT 2800 3200 --grids 5 --quantity 0.1
         """
     )
     
@@ -396,7 +741,9 @@ Examples:
     parser.add_argument('--quantity', type=float, required=True,
                        help='Quantity per grid level')
     parser.add_argument('--interval', type=int, default=5,
-                       help='Check interval in seconds (default: 5)')
+                       help='Seconds to wait for a fill before running periodic checks (default: 5)')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Log fills without printing them to the console')
     
     args = parser.parse_args()
     
@@ -413,6 +760,8 @@ Examples:
         print("✗ Error: Quantity must be positive")
         sys.exit(1)
     
+    setup_logging()
+    
     try:
         client = get_client()
         trader = GridTrader(
@@ -421,7 +770,8 @@ Examples:
             lower_price=args.lower_price,
             upper_price=args.upper_price,
             num_grids=args.grids,
-            quantity_per_grid=args.quantity
+            quantity_per_grid=args.quantity,
+            verbose=not args.quiet
         )
         
         trader.run(check_interval=args.interval)
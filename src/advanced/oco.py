@@ -4,32 +4,54 @@ Places take-profit and stop-loss orders simultaneously
 """
 
 import sys
+import time
+import queue
 import logging
-from pathlib import Path
+import threading
+from typing import Optional
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
+import ujson
 
+from binance import ThreadedWebsocketManager
 from binance.exceptions import BinanceAPIException
-from config import get_client, setup_logging
-from utils import (
-    validate_symbol, validate_quantity, validate_price, validate_side,
-    check_balance, get_current_price, validate_notional, ValidationError
+from src.config import get_client, setup_logging, LISTEN_KEY_KEEPALIVE, QUIET
+from src.utils import (
+    validate_symbol, validate_quantity, validate_prices, validate_side,
+    check_balance, get_current_price, validate_min_notional, ValidationError
 )
 
 logger = logging.getLogger(__name__)
 
+# Separator lines, built once at import
+_SEP = "=" * 60
+_DASH = "-" * 60
+
+# Upper bound in seconds for the REST polling fallback's backoff
+MAX_POLL_INTERVAL = 10.0
+
+# Seconds without a stream event before both legs are rechecked over REST.
+# The stream can miss fills while it is still subscribing or silently
+# reconnecting, and a leg left live after its sibling fills opens a position.
+STREAM_RECONCILE_INTERVAL = 30.0
+
 def place_oco_order(symbol: str, side: str, quantity: float,
                     take_profit_price: float, stop_loss_price: float,
-                    stop_limit_price: float) -> tuple:
+                    stop_limit_price: Optional[float] = None,
+                    close_position: bool = False) -> tuple:
     """
     Place OCO (One-Cancels-the-Other) order on Binance Futures
     
     OCO orders combine take-profit and stop-loss orders. When one executes,
     the other is automatically cancelled.
     
-    Note: Binance Futures doesn't support native OCO orders, so this function
-    simulates OCO by placing two separate orders and monitoring them.
+    By default OCO is simulated with a LIMIT take-profit and a STOP stop-loss
+    for the given quantity, which must be monitored (see monitor_oco_orders).
+    With close_position=True, a TAKE_PROFIT_MARKET and a STOP_MARKET order
+    with closePosition=true are placed instead. They close the whole
+    position, and Binance cancels the remaining one once the position is
+    flat, so no monitoring is needed. In that mode quantity only feeds the
+    notional check, which uses the stop-loss price, and stop_limit_price is
+    ignored.
     
     Args:
         symbol: Trading pair (e.g., 'BTCUSDT')
@@ -37,7 +59,9 @@ def place_oco_order(symbol: str, side: str, quantity: float,
         quantity: Amount to trade
         take_profit_price: Price for take-profit limit order
         stop_loss_price: Stop price for stop-loss order
-        stop_limit_price: Limit price for stop-loss order
+        stop_limit_price: Limit price for stop-loss order; required unless
+            close_position is set
+        close_position: Use position-linked TP/SL market orders
         
     Returns:
         tuple: (take_profit_order, stop_loss_order)
@@ -64,149 +88,172 @@ def place_oco_order(symbol: str, side: str, quantity: float,
         side = validate_side(side)
         validate_symbol(client, symbol)
         quantity = validate_quantity(client, symbol, quantity)
-        take_profit_price = validate_price(client, symbol, take_profit_price)
-        stop_loss_price = validate_price(client, symbol, stop_loss_price)
-        stop_limit_price = validate_price(client, symbol, stop_limit_price)
+        if close_position:
+            # The stop leg is a STOP_MARKET, so it fills around the stop price
+            take_profit_price, stop_loss_price = validate_prices(
+                client, symbol, (take_profit_price, stop_loss_price)
+            )
+            notional_prices = (take_profit_price, stop_loss_price)
+        else:
+            if stop_limit_price is None:
+                raise ValidationError("Stop-limit price is required unless close_position is set")
+            take_profit_price, stop_loss_price, stop_limit_price = validate_prices(
+                client, symbol, (take_profit_price, stop_loss_price, stop_limit_price)
+            )
+            notional_prices = (take_profit_price, stop_limit_price)
         
-        # Validate notional values
-        validate_notional(client, symbol, quantity, take_profit_price)
-        validate_notional(client, symbol, quantity, stop_limit_price)
+        # Validate notional values; the lower price is the binding one
+        validate_min_notional(client, symbol, quantity, *notional_prices)
         
         # Get current market price
         current_price = get_current_price(client, symbol)
         logger.info(f"Current market price: {current_price}")
         
-        # Validate price relationships
-        if side == 'SELL':
-            # For closing long positions
-            if take_profit_price <= current_price:
-                logger.warning(
-                    f"Take-profit price {take_profit_price} is at or below "
-                    f"current price {current_price}"
-                )
-            
-            if stop_loss_price >= current_price:
-                logger.warning(
-                    f"Stop-loss price {stop_loss_price} is at or above "
-                    f"current price {current_price}"
-                )
-            
-            if stop_limit_price > stop_loss_price:
-                raise ValidationError(
-                    f"Stop-limit price ({stop_limit_price}) should be <= "
-                    f"stop price ({stop_loss_price})"
-                )
-            
-            if take_profit_price <= stop_loss_price:
-                raise ValidationError(
-                    f"Take-profit price ({take_profit_price}) must be > "
-                    f"stop-loss price ({stop_loss_price})"
-                )
-        
-        elif side == 'BUY':
-            # For closing short positions
-            if take_profit_price >= current_price:
-                logger.warning(
-                    f"Take-profit price {take_profit_price} is at or above "
-                    f"current price {current_price}"
-                )
-            
-            if stop_loss_price <= current_price:
-                logger.warning(
-                    f"Stop-loss price {stop_loss_price} is at or below "
-                    f"current price {current_price}"
-                )
-            
-            if stop_limit_price < stop_loss_price:
-                raise ValidationError(
-                    f"Stop-limit price ({stop_limit_price}) should be >= "
-                    f"stop price ({stop_loss_price})"
-                )
-            
-            if take_profit_price >= stop_loss_price:
-                raise ValidationError(
-                    f"Take-profit price ({take_profit_price}) must be < "
-                    f"stop-loss price ({stop_loss_price})"
-                )
+        # Validate price relationships; sign folds the SELL (closing long)
+        # and BUY (closing short) cases into one set of comparisons
+        sign = 1 if side == 'SELL' else -1
+        below, above = ('below', 'above') if sign > 0 else ('above', 'below')
+        
+        if sign * (take_profit_price - current_price) <= 0:
+            logger.warning(
+                f"Take-profit price {take_profit_price} is at or {below} "
+                f"current price {current_price}"
+            )
+        
+        if sign * (current_price - stop_loss_price) <= 0:
+            logger.warning(
+                f"Stop-loss price {stop_loss_price} is at or {above} "
+                f"current price {current_price}"
+            )
+        
+        error = None
+        if not close_position and sign * (stop_loss_price - stop_limit_price) < 0:
+            error = (
+                f"Stop-limit price ({stop_limit_price}) should be "
+                f"{'<=' if sign > 0 else '>='} stop price ({stop_loss_price})"
+            )
+        elif sign * (take_profit_price - stop_loss_price) <= 0:
+            error = (
+                f"Take-profit price ({take_profit_price}) must be "
+                f"{'>' if sign > 0 else '<'} stop-loss price ({stop_loss_price})"
+            )
+        
+        if error:
+            raise ValidationError(error)
         
         # Check balance
         balance = check_balance(client, 'USDT')
         logger.info(f"Available balance: {balance:.2f} USDT")
         
-        # Place take-profit limit order
-        logger.info(f"Placing take-profit order at {take_profit_price}")
+        # Place both legs in one batchOrders request
+        logger.info(
+            f"Placing take-profit order at {take_profit_price} and "
+            f"stop-loss order at {stop_loss_price}"
+        )
         
-        take_profit_order = client.futures_create_order(
-            symbol=symbol,
-            side=side,
-            type='LIMIT',
-            timeInForce='GTC',
-            quantity=quantity,
-            price=take_profit_price
+        if close_position:
+            # closePosition orders carry no quantity and reject reduceOnly
+            take_profit_params = {
+                'symbol': symbol,
+                'side': side,
+                'type': 'TAKE_PROFIT_MARKET',
+                'stopPrice': str(take_profit_price),
+                'closePosition': 'true'
+            }
+            stop_loss_params = {
+                'symbol': symbol,
+                'side': side,
+                'type': 'STOP_MARKET',
+                'stopPrice': str(stop_loss_price),
+                'closePosition': 'true'
+            }
+        else:
+            take_profit_params = {
+                'symbol': symbol,
+                'side': side,
+                'type': 'LIMIT',
+                'timeInForce': 'GTC',
+                'quantity': str(quantity),
+                'price': str(take_profit_price)
+            }
+            stop_loss_params = {
+                'symbol': symbol,
+                'side': side,
+                'type': 'STOP',
+                'timeInForce': 'GTC',
+                'quantity': str(quantity),
+                'price': str(stop_limit_price),
+                'stopPrice': str(stop_loss_price)
+            }
+        
+        take_profit_order, stop_loss_order = client.futures_place_batch_order(
+            batchOrders=ujson.dumps([take_profit_params, stop_loss_params])
         )
         
-        logger.info(f"Take-profit order placed: ID={take_profit_order['orderId']}")
+        # Each entry is either an order or a {code, msg} error
+        legs = (('Take-profit', take_profit_order), ('Stop-loss', stop_loss_order))
+        failed = [(name, result) for name, result in legs if 'orderId' not in result]
         
-        # Place stop-loss order
-        logger.info(f"Placing stop-loss order at {stop_loss_price}")
-        
-        try:
-            stop_loss_order = client.futures_create_order(
-                symbol=symbol,
-                side=side,
-                type='STOP',
-                timeInForce='GTC',
-                quantity=quantity,
-                price=stop_limit_price,
-                stopPrice=stop_loss_price
-            )
-            
-            logger.info(f"Stop-loss order placed: ID={stop_loss_order['orderId']}")
-            
-        except Exception as e:
-            # If stop-loss fails, cancel take-profit to maintain OCO integrity
-            logger.error(f"Stop-loss order failed, cancelling take-profit: {e}")
-            try:
-                client.futures_cancel_order(
-                    symbol=symbol,
-                    orderId=take_profit_order['orderId']
-                )
-                logger.info("Take-profit order cancelled")
-            except Exception as cancel_error:
-                logger.error(f"Failed to cancel take-profit order: {cancel_error}")
+        if failed:
+            # Cancel whichever leg was placed to maintain OCO integrity
+            for name, result in legs:
+                if 'orderId' not in result:
+                    logger.error(f"{name} order failed: {result.get('msg')}")
+                    continue
+                
+                try:
+                    client.futures_cancel_order(symbol=symbol, orderId=result['orderId'])
+                    logger.info(f"{name} order cancelled")
+                except Exception as cancel_error:
+                    logger.error(f"Failed to cancel {name.lower()} order: {cancel_error}")
             
-            raise ValidationError(f"OCO order failed: {e}")
+            raise ValidationError(
+                "OCO order failed: " +
+                "; ".join(f"{name}: {result.get('msg')}" for name, result in failed)
+            )
+        
+        logger.info(f"Take-profit order placed: ID={take_profit_order['orderId']}")
+        logger.info(f"Stop-loss order placed: ID={stop_loss_order['orderId']}")
         
         # Log success
-        logger.info("=" * 60)
-        logger.info("OCO ORDER PLACED SUCCESSFULLY")
-        logger.info(f"Take-Profit Order ID: {take_profit_order['orderId']}")
-        logger.info(f"Stop-Loss Order ID: {stop_loss_order['orderId']}")
-        logger.info("=" * 60)
-        
-        # Print to console
-        print("\n✓ OCO Order Placed Successfully!")
-        print("\n" + "=" * 60)
-        print(f"Symbol: {symbol}")
-        print(f"Side: {side}")
-        print(f"Quantity: {quantity}")
-        print(f"\nCurrent Price: {current_price}")
-        print(f"Take-Profit Price: {take_profit_price}")
-        print(f"Stop-Loss Price: {stop_loss_price}")
-        print(f"Stop-Limit Price: {stop_limit_price}")
-        print("\n" + "-" * 60)
-        print(f"Take-Profit Order ID: {take_profit_order['orderId']}")
-        print(f"Stop-Loss Order ID: {stop_loss_order['orderId']}")
-        print("=" * 60)
-        
-        if side == 'SELL':
-            profit_pct = ((take_profit_price - current_price) / current_price) * 100
-            loss_pct = ((current_price - stop_loss_price) / current_price) * 100
-            print(f"\nPotential Profit: +{profit_pct:.2f}%")
-            print(f"Potential Loss: -{loss_pct:.2f}%")
-            print(f"Risk/Reward Ratio: 1:{profit_pct/loss_pct:.2f}")
-        
-        print("\n⚠ Note: Monitor these orders. When one fills, manually cancel the other.")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_SEP)
+            logger.info("OCO ORDER PLACED SUCCESSFULLY")
+            logger.info(f"Take-Profit Order ID: {take_profit_order['orderId']}")
+            logger.info(f"Stop-Loss Order ID: {stop_loss_order['orderId']}")
+            logger.info(_SEP)
+        
+        # Print to console in a single write
+        if not QUIET:
+            lines = [
+                "\n✓ OCO Order Placed Successfully!",
+                "\n" + _SEP,
+                f"Symbol: {symbol}",
+                f"Side: {side}",
+                f"Quantity: {quantity}",
+                f"\nCurrent Price: {current_price}",
+                f"Take-Profit Price: {take_profit_price}",
+                f"Stop-Loss Price: {stop_loss_price}",
+                f"Stop-Limit Price: {'MARKET' if close_position else stop_limit_price}",
+                "\n" + _DASH,
+                f"Take-Profit Order ID: {take_profit_order['orderId']}",
+                f"Stop-Loss Order ID: {stop_loss_order['orderId']}",
+                _SEP,
+            ]
+            
+            if side == 'SELL':
+                profit_pct = ((take_profit_price - current_price) / current_price) * 100
+                loss_pct = ((current_price - stop_loss_price) / current_price) * 100
+                lines.append(f"\nPotential Profit: +{profit_pct:.2f}%")
+                lines.append(f"Potential Loss: -{loss_pct:.2f}%")
+                lines.append(f"Risk/Reward Ratio: 1:{profit_pct/loss_pct:.2f}")
+            
+            if close_position:
+                lines.append("\n⚠ Note: Both orders close the whole position; the other is cancelled once it is flat.")
+            else:
+                lines.append("\n⚠ Note: Monitor these orders. When one fills, manually cancel the other.")
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
         
         return take_profit_order, stop_loss_order
         
@@ -229,92 +276,196 @@ def monitor_oco_orders(symbol: str, tp_order_id: int, sl_order_id: int):
     """
     Monitor OCO orders and cancel the counterpart when one fills
     
+    Fills are pushed over the futures user-data stream, and both legs are
+    also rechecked over REST whenever the stream has been quiet for
+    STREAM_RECONCILE_INTERVAL seconds. If the stream reports an error,
+    monitoring falls back to polling the orders over REST.
+    
     Args:
         symbol: Trading pair
         tp_order_id: Take-profit order ID
         sl_order_id: Stop-loss order ID
     """
-    import time
+    client = None
+    socket_manager = None
+    listen_key = None
+    keepalive_stop = threading.Event()
     
     try:
         client = get_client()
         logger.info(f"Monitoring OCO orders: TP={tp_order_id}, SL={sl_order_id}")
         
-        while True:
-            # Check take-profit order
-            tp_order = client.futures_get_order(symbol=symbol, orderId=tp_order_id)
-            sl_order = client.futures_get_order(symbol=symbol, orderId=sl_order_id)
-            
-            if tp_order['status'] == 'FILLED':
-                logger.info(f"Take-profit order filled! Cancelling stop-loss...")
-                client.futures_cancel_order(symbol=symbol, orderId=sl_order_id)
-                print("\n✓ Take-profit triggered! Stop-loss cancelled.")
-                break
+        # Filled order IDs, or None when the stream can no longer be trusted
+        fills = queue.Queue()
+        
+        def on_message(msg: dict):
+            data = msg.get('data', msg)
+            event_type = data.get('e')
             
-            if sl_order['status'] == 'FILLED':
-                logger.info(f"Stop-loss order filled! Cancelling take-profit...")
-                client.futures_cancel_order(symbol=symbol, orderId=tp_order_id)
-                print("\n✗ Stop-loss triggered! Take-profit cancelled.")
-                break
+            if event_type == 'ORDER_TRADE_UPDATE':
+                order = data['o']
+                if order['i'] in (tp_order_id, sl_order_id) and order['X'] == 'FILLED':
+                    fills.put(order['i'])
+            elif event_type in ('error', 'listenKeyExpired'):
+                logger.warning(f"User-data stream failed: {data.get('m', event_type)}")
+                fills.put(None)
+        
+        def keep_listen_key_alive():
+            while not keepalive_stop.wait(LISTEN_KEY_KEEPALIVE):
+                try:
+                    client.futures_stream_keepalive(listenKey=listen_key)
+                except Exception as e:
+                    logger.warning(f"listenKey keepalive failed: {e}")
+        
+        listen_key = client.futures_stream_get_listen_key()
+        socket_manager = ThreadedWebsocketManager(
+            api_key=client.API_KEY,
+            api_secret=client.API_SECRET,
+            testnet=client.testnet
+        )
+        socket_manager.start()
+        socket_manager.start_futures_multiplex_socket(callback=on_message, streams=[listen_key])
+        threading.Thread(target=keep_listen_key_alive, daemon=True).start()
+        
+        # Catch a fill that happened before the stream was subscribed
+        filled_id = _get_filled_order_id(client, symbol, tp_order_id, sl_order_id)
+        
+        stream_failed = False
+        while filled_id is None and not stream_failed:
+            try:
+                event = fills.get(timeout=STREAM_RECONCILE_INTERVAL)
+            except queue.Empty:
+                # Safety net for fills the stream never delivered
+                filled_id = _get_filled_order_id(client, symbol, tp_order_id, sl_order_id)
+                continue
             
-            time.sleep(1)  # Check every second
+            if event is None:
+                stream_failed = True
+            else:
+                filled_id = event
+        
+        # Stream is down; poll every second at first, backing off to 10s
+        poll_start = time.monotonic()
+        while filled_id is None:
+            elapsed = time.monotonic() - poll_start
+            time.sleep(min(MAX_POLL_INTERVAL, 1.3 ** (elapsed // 5)))
+            filled_id = _get_filled_order_id(client, symbol, tp_order_id, sl_order_id)
+        
+        if filled_id == tp_order_id:
+            logger.info(f"Take-profit order filled! Cancelling stop-loss...")
+            client.futures_cancel_order(symbol=symbol, orderId=sl_order_id)
+            print("\n✓ Take-profit triggered! Stop-loss cancelled.")
+        else:
+            logger.info(f"Stop-loss order filled! Cancelling take-profit...")
+            client.futures_cancel_order(symbol=symbol, orderId=tp_order_id)
+            print("\n✗ Stop-loss triggered! Take-profit cancelled.")
             
     except KeyboardInterrupt:
         logger.info("OCO monitoring stopped by user")
         print("\n\nMonitoring stopped. Orders still active.")
     except Exception as e:
         logger.error(f"Error monitoring OCO orders: {e}")
+    finally:
+        keepalive_stop.set()
+        if socket_manager:
+            socket_manager.stop()
+        if listen_key:
+            try:
+                client.futures_stream_close(listenKey=listen_key)
+            except Exception as e:
+                logger.warning(f"Failed to close listenKey: {e}")
+
+def _get_filled_order_id(client, symbol: str, tp_order_id: int,
+                         sl_order_id: int) -> Optional[int]:
+    """
+    Check both OCO legs over REST
+    
+    Both legs are looked up in one open-orders call; a leg that is no longer
+    open is then fetched individually to tell a fill from a cancel.
+    
+    Args:
+        client: Binance client instance
+        symbol: Trading pair
+        tp_order_id: Take-profit order ID
+        sl_order_id: Stop-loss order ID
+        
+    Returns:
+        int: ID of the filled leg, or None if neither has filled
+    """
+    open_ids = {o['orderId'] for o in client.futures_get_open_orders(symbol=symbol)}
+    for order_id in (tp_order_id, sl_order_id):
+        if order_id in open_ids:
+            continue
+        order = client.futures_get_order(symbol=symbol, orderId=order_id)
+        if order['status'] == 'FILLED':
+            return order_id
+    return None
 
 def main():
     """
     CLI entry point for OCO orders
     
     Usage:
-        python oco.py SYMBOL SIDE QUANTITY TP_PRICE SL_PRICE SL_LIMIT_PRICE
+        python -m src.advanced.oco SYMBOL SIDE QUANTITY TP_PRICE SL_PRICE SL_LIMIT_PRICE
+        python -m src.advanced.oco SYMBOL SIDE QUANTITY TP_PRICE SL_PRICE [SL_LIMIT_PRICE] --close-position
         
     Examples:
         # Close long position with TP at $52k, SL at $48k
-        python oco.py BTCUSDT SELL 0.01 52000 48000 47500
+        python -m src.advanced.oco BTCUSDT SELL 0.01 52000 48000 47500
+        
+        # Same, attached to the whole position
+        python -m src.advanced.oco BTCUSDT SELL 0.01 52000 48000 --close-position
     """
-    if len(sys.argv) != 7:
-        print("\nUsage: python oco.py SYMBOL SIDE QUANTITY TP_PRICE SL_PRICE SL_LIMIT_PRICE")
+    close_position = '--close-position' in sys.argv
+    if close_position:
+        sys.argv.remove('--close-position')
+    
+    if len(sys.argv) != 7 and not (close_position and len(sys.argv) == 6):
+        print("\nUsage: python -m src.advanced.oco SYMBOL SIDE QUANTITY TP_PRICE SL_PRICE SL_LIMIT_PRICE")
+        print("       python -m src.advanced.oco SYMBOL SIDE QUANTITY TP_PRICE SL_PRICE [SL_LIMIT_PRICE] --close-position")
         print("\nExample:")
         print("  # After buying BTC, set take-profit and stop-loss")
-        print("  python oco.py BTCUSDT SELL 0.01 52000 48000 47500")
+        print("  python -m src.advanced.oco BTCUSDT SELL 0.01 52000 48000 47500")
         print("\nArguments:")
         print("  SYMBOL          - Trading pair (e.g., BTCUSDT)")
         print("  SIDE            - BUY or SELL")
         print("  QUANTITY        - Amount to trade")
         print("  TP_PRICE        - Take-profit price")
         print("  SL_PRICE        - Stop-loss trigger price")
-        print("  SL_LIMIT_PRICE  - Stop-loss limit price")
+        print("  SL_LIMIT_PRICE  - Stop-loss limit price (ignored with --close-position)")
+        print("  --close-position - Place position-linked TP/SL market orders instead")
         print("\nTip: For long positions, use SELL side to close with profit/loss")
         sys.exit(1)
     
-    symbol = sys.argv[1].upper()
-    side = sys.argv[2].upper()
+    _, symbol, side, *nums = sys.argv
+    symbol = symbol.upper()
+    side = side.upper()
     
     try:
-        quantity = float(sys.argv[3])
-        tp_price = float(sys.argv[4])
-        sl_price = float(sys.argv[5])
-        sl_limit_price = float(sys.argv[6])
+        values = [float(n) for n in nums]
         
-        if any(x <= 0 for x in [quantity, tp_price, sl_price, sl_limit_price]):
+        if min(values) <= 0:
             raise ValueError("All numeric values must be positive")
             
     except ValueError as e:
         print(f"\n✗ Invalid input: {e}")
         sys.exit(1)
     
+    quantity, tp_price, sl_price = values[:3]
+    sl_limit_price = values[3] if len(values) == 4 else None
+    
+    setup_logging()
+    
     try:
-        logger.info("=" * 60)
-        logger.info("OCO ORDER REQUEST")
-        logger.info(f"Symbol: {symbol} | Side: {side} | Quantity: {quantity}")
-        logger.info(f"Take-Profit: {tp_price} | Stop-Loss: {sl_price}/{sl_limit_price}")
-        logger.info("=" * 60)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_SEP)
+            logger.info("OCO ORDER REQUEST")
+            logger.info(f"Symbol: {symbol} | Side: {side} | Quantity: {quantity}")
+            logger.info(f"Take-Profit: {tp_price} | Stop-Loss: {sl_price}/{sl_limit_price}")
+            logger.info(_SEP)
         
-        place_oco_order(symbol, side, quantity, tp_price, sl_price, sl_limit_price)
+        place_oco_order(symbol, side, quantity, tp_price, sl_price, sl_limit_price,
+                        close_position=close_position)
         
     except KeyboardInterrupt:
         logger.info("OCO order cancelled by user")
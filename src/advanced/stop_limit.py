@@ -5,21 +5,21 @@ Triggers a limit order when stop price is reached
 
 import sys
 import logging
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
 
 from binance.exceptions import BinanceAPIException
-from config import get_client, setup_logging
-from utils import (
-    validate_symbol, validate_quantity, validate_price, validate_side,
+from src.config import get_client, setup_logging, FAST_PATH, QUIET
+from src.advanced._fast_order import submit_stop_limit
+from src.utils import (
+    validate_order, validate_price, validate_side,
     check_balance, format_order_response, get_current_price,
-    validate_notional, ValidationError
+    ValidationError
 )
 
 logger = logging.getLogger(__name__)
 
+# Separator lines, built once at import
+_SEP = "=" * 60
+
 def place_stop_limit_order(symbol: str, side: str, quantity: float, 
                            stop_price: float, limit_price: float,
                            time_in_force: str = 'GTC') -> dict:
@@ -30,6 +30,9 @@ def place_stop_limit_order(symbol: str, side: str, quantity: float,
     - For SELL orders: Triggers when price drops to stop_price (stop-loss)
     - For BUY orders: Triggers when price rises to stop_price (stop-buy)
     
+    The first request on a new client pays for the TCP/TLS handshake; later
+    requests reuse the kept-alive connection (see config.get_client).
+    
     Args:
         symbol: Trading pair (e.g., 'BTCUSDT')
         side: 'BUY' or 'SELL'
@@ -63,46 +66,30 @@ def place_stop_limit_order(symbol: str, side: str, quantity: float,
         )
         
         side = validate_side(side)
-        validate_symbol(client, symbol)
-        quantity = validate_quantity(client, symbol, quantity)
+        # Notional value is checked at the limit price
+        quantity, limit_price = validate_order(client, symbol, quantity, limit_price)
         stop_price = validate_price(client, symbol, stop_price)
-        limit_price = validate_price(client, symbol, limit_price)
-        
-        # Validate notional value
-        validate_notional(client, symbol, quantity, limit_price)
         
         # Get current market price
         current_price = get_current_price(client, symbol)
         logger.info(f"Current market price: {current_price}")
         
-        # Validate stop-limit price relationship
-        if side == 'SELL':
-            # Stop-loss: stop_price should be below current, limit below stop
-            if stop_price >= current_price:
-                logger.warning(
-                    f"Stop-loss order: stop price {stop_price} is above or equal to "
-                    f"current price {current_price}. Order will trigger immediately."
-                )
-            
-            if limit_price > stop_price:
-                raise ValidationError(
-                    f"For SELL stop-limit: limit price ({limit_price}) should be "
-                    f"<= stop price ({stop_price})"
-                )
-        
-        elif side == 'BUY':
-            # Stop-buy: stop_price should be above current, limit above stop
-            if stop_price <= current_price:
-                logger.warning(
-                    f"Stop-buy order: stop price {stop_price} is below or equal to "
-                    f"current price {current_price}. Order will trigger immediately."
-                )
-            
-            if limit_price < stop_price:
-                raise ValidationError(
-                    f"For BUY stop-limit: limit price ({limit_price}) should be "
-                    f">= stop price ({stop_price})"
-                )
+        # Validate stop-limit price relationship. SELL is a stop-loss (stop
+        # below current, limit below stop); BUY is a stop-buy (both above)
+        sign = 1 if side == 'SELL' else -1
+        
+        if sign * (current_price - stop_price) <= 0:
+            logger.warning(
+                f"{'Stop-loss' if sign > 0 else 'Stop-buy'} order: stop price {stop_price} "
+                f"is {'above' if sign > 0 else 'below'} or equal to "
+                f"current price {current_price}. Order will trigger immediately."
+            )
+        
+        if sign * (stop_price - limit_price) < 0:
+            raise ValidationError(
+                f"For {side} stop-limit: limit price ({limit_price}) should be "
+                f"{'<=' if sign > 0 else '>='} stop price ({stop_price})"
+            )
         
         # Check balance
         balance = check_balance(client, 'USDT')
@@ -120,31 +107,42 @@ def place_stop_limit_order(symbol: str, side: str, quantity: float,
             f"@ stop={stop_price}, limit={limit_price}"
         )
         
-        order = client.futures_create_order(
-            symbol=symbol,
-            side=side,
-            type='STOP',
-            timeInForce=time_in_force,
-            quantity=quantity,
-            price=limit_price,
-            stopPrice=stop_price
-        )
+        if FAST_PATH:
+            order = submit_stop_limit(
+                client, symbol, side, quantity, limit_price, stop_price, time_in_force
+            )
+        else:
+            order = client.futures_create_order(
+                symbol=symbol,
+                side=side,
+                type='STOP',
+                timeInForce=time_in_force,
+                quantity=quantity,
+                price=limit_price,
+                stopPrice=stop_price
+            )
         
         # Log success
         logger.info(f"Stop-limit order placed successfully!")
-        logger.info(format_order_response(order))
-        
-        # Print to console
-        print("\n✓ Stop-Limit Order Placed Successfully!")
-        print(format_order_response(order))
-        print(f"\nCurrent Market Price: {current_price}")
-        print(f"Stop Price: {stop_price}")
-        print(f"Limit Price: {limit_price}")
-        
-        if side == 'SELL':
-            print(f"\n⚠ Stop-Loss: Will trigger SELL if price drops to {stop_price}")
-        else:
-            print(f"\n⚠ Stop-Buy: Will trigger BUY if price rises to {stop_price}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(format_order_response(order))
+        
+        # Print to console in a single write
+        if not QUIET:
+            if side == 'SELL':
+                trigger = f"\n⚠ Stop-Loss: Will trigger SELL if price drops to {stop_price}"
+            else:
+                trigger = f"\n⚠ Stop-Buy: Will trigger BUY if price rises to {stop_price}"
+            
+            sys.stdout.write("\n".join([
+                "\n✓ Stop-Limit Order Placed Successfully!",
+                format_order_response(order),
+                f"\nCurrent Market Price: {current_price}",
+                f"Stop Price: {stop_price}",
+                f"Limit Price: {limit_price}",
+                trigger,
+            ]) + "\n")
+            sys.stdout.flush()
         
         return order
         
@@ -168,22 +166,22 @@ def main():
     CLI entry point for stop-limit orders
     
     Usage:
-        python stop_limit.py SYMBOL SIDE QUANTITY STOP_PRICE LIMIT_PRICE [TIME_IN_FORCE]
+        python -m src.advanced.stop_limit SYMBOL SIDE QUANTITY STOP_PRICE LIMIT_PRICE [TIME_IN_FORCE]
         
     Examples:
         # Stop-loss: Sell if price drops to $48,000, limit at $47,500
-        python stop_limit.py BTCUSDT SELL 0.01 48000 47500
+        python -m src.advanced.stop_limit BTCUSDT SELL 0.01 48000 47500
         
         # Stop-buy: Buy if price rises to $52,000, limit at $52,500
-        python stop_limit.py BTCUSDT BUY 0.01 52000 52500
+        python -m src.advanced.stop_limit BTCUSDT BUY 0.01 52000 52500
     """
     if len(sys.argv) < 6:
-        print("\nUsage: python stop_limit.py SYMBOL SIDE QUANTITY STOP_PRICE LIMIT_PRICE [TIME_IN_FORCE]")
+        print("\nUsage: python -m src.advanced.stop_limit SYMBOL SIDE QUANTITY STOP_PRICE LIMIT_PRICE [TIME_IN_FORCE]")
         print("\nExamples:")
         print("  # Stop-loss example")
-        print("  python stop_limit.py BTCUSDT SELL 0.01 48000 47500")
+        print("  python -m src.advanced.stop_limit BTCUSDT SELL 0.01 48000 47500")
         print("\n  # Stop-buy example")
-        print("  python stop_limit.py BTCUSDT BUY 0.01 52000 52500")
+        print("  python -m src.advanced.stop_limit BTCUSDT BUY 0.01 52000 52500")
         print("\nArguments:")
         print("  SYMBOL        - Trading pair (e.g., BTCUSDT)")
         print("  SIDE          - BUY or SELL")
@@ -196,31 +194,33 @@ def main():
         print("  BUY  - Stop-buy entry (triggers when price rises)")
         sys.exit(1)
     
-    symbol = sys.argv[1].upper()
-    side = sys.argv[2].upper()
-    time_in_force = sys.argv[6].upper() if len(sys.argv) > 6 else 'GTC'
+    _, symbol, side, *nums = sys.argv
+    symbol = symbol.upper()
+    side = side.upper()
+    time_in_force = nums[3].upper() if len(nums) > 3 else 'GTC'
     
     try:
-        quantity = float(sys.argv[3])
-        stop_price = float(sys.argv[4])
-        limit_price = float(sys.argv[5])
+        quantity, stop_price, limit_price = map(float, nums[:3])
         
-        if quantity <= 0 or stop_price <= 0 or limit_price <= 0:
+        if min(quantity, stop_price, limit_price) <= 0:
             raise ValueError("All numeric values must be positive")
             
     except ValueError as e:
         print(f"\n✗ Invalid input: {e}")
         sys.exit(1)
     
+    setup_logging()
+    
     try:
-        logger.info("=" * 60)
-        logger.info("STOP-LIMIT ORDER REQUEST")
-        logger.info(
-            f"Symbol: {symbol} | Side: {side} | Quantity: {quantity} | "
-            f"Stop: {stop_price} | Limit: {limit_price}"
-        )
-        logger.info(f"Time In Force: {time_in_force}")
-        logger.info("=" * 60)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_SEP)
+            logger.info("STOP-LIMIT ORDER REQUEST")
+            logger.info(
+                f"Symbol: {symbol} | Side: {side} | Quantity: {quantity} | "
+                f"Stop: {stop_price} | Limit: {limit_price}"
+            )
+            logger.info(f"Time In Force: {time_in_force}")
+            logger.info(_SEP)
         
         place_stop_limit_order(symbol, side, quantity, stop_price, limit_price, time_in_force)
         
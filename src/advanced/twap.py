@@ -7,26 +7,43 @@ import sys
 import time
 import logging
 import argparse
-from pathlib import Path
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
+import numpy as np
+import ujson
 
+from binance import ThreadedWebsocketManager
 from binance.exceptions import BinanceAPIException
-from config import get_client, setup_logging
-from utils import (
+from src.config import get_client, setup_logging
+from src.utils import (
     validate_symbol, validate_quantity, validate_side,
     check_balance, get_current_price, ValidationError
 )
 
 logger = logging.getLogger(__name__)
 
+# Separator line, built once at import
+_SEP = "=" * 60
+
+# Chunk orders that may be awaiting a response at once
+MAX_CHUNKS_IN_FLIGHT = 4
+
+# Most orders Binance accepts in one batchOrders request
+BATCH_ORDER_LIMIT = 5
+
+# (executed quantity, average price) per filled chunk
+_FILL_DTYPE = np.dtype([('qty', 'f8'), ('price', 'f8')])
+
+# What to do with the remaining chunks after one fails
+ON_FAILURE_POLICIES = ('ask', 'continue', 'abort')
+
 class TWAPExecutor:
     """Execute TWAP strategy for large orders"""
     
     def __init__(self, client, symbol: str, side: str, total_quantity: float,
-                 num_chunks: int, interval_seconds: int):
+                 num_chunks: int, interval_seconds: int, batch_size: int = BATCH_ORDER_LIMIT,
+                 confirm: bool = True, on_failure: str = 'ask'):
         """
         Initialize TWAP executor
         
@@ -36,17 +53,35 @@ class TWAPExecutor:
             side: BUY or SELL
             total_quantity: Total amount to trade
             num_chunks: Number of smaller orders
-            interval_seconds: Time between orders
+            interval_seconds: Time between orders (0 sends all chunks at once)
+            batch_size: Chunks per batchOrders request when interval_seconds is 0
+            confirm: Wait for ENTER before the first chunk
+            on_failure: After a failed chunk, 'ask', 'continue' or 'abort'
+            
+        Raises:
+            ValidationError: If batch_size is outside 1..BATCH_ORDER_LIMIT
         """
+        if not 1 <= batch_size <= BATCH_ORDER_LIMIT:
+            raise ValidationError(f"Batch size must be between 1 and {BATCH_ORDER_LIMIT}")
+        
         self.client = client
         self.symbol = symbol
         self.side = side
         self.total_quantity = total_quantity
         self.num_chunks = num_chunks
         self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.confirm = confirm
+        self.on_failure = on_failure
         self.chunk_size = total_quantity / num_chunks
-        self.executed_orders = []
+        # Slot per chunk, filled by chunk number as responses arrive (None until filled)
+        self.executed_orders = [None] * num_chunks
         self.failed_orders = []
+        self.deadlines = None
+        self._order_params = None
+        self.socket_manager = None
+        self._last_price = None
+        self._wall_offset = 0.0
         
     def validate(self):
         """Validate TWAP parameters"""
@@ -59,7 +94,15 @@ class TWAPExecutor:
         # Recalculate total based on adjusted chunk size
         self.total_quantity = self.chunk_size * self.num_chunks
         
-        logger.info(f"TWAP validated: {self.num_chunks} chunks of {self.chunk_size} {self.symbol}")
+        # Every chunk is the same order, so its parameters are built once
+        self._order_params = {
+            'symbol': self.symbol,
+            'side': self.side,
+            'type': 'MARKET',
+            'quantity': str(self.chunk_size)
+        }
+        
+        logger.info("TWAP validated: %d chunks of %s %s", self.num_chunks, self.chunk_size, self.symbol)
         
     def execute_chunk(self, chunk_num: int) -> dict:
         """
@@ -72,30 +115,24 @@ class TWAPExecutor:
             dict: Order response
         """
         try:
-            logger.info(f"Executing chunk {chunk_num}/{self.num_chunks}: {self.chunk_size} {self.symbol}")
-            
-            order = self.client.futures_create_order(
-                symbol=self.symbol,
-                side=self.side,
-                type='MARKET',
-                quantity=self.chunk_size
+            logger.info(
+                "Executing chunk %d/%d: %s %s",
+                chunk_num, self.num_chunks, self.chunk_size, self.symbol
             )
             
-            self.executed_orders.append(order)
+            order = self.client.futures_create_order(**self._order_params)
             
-            executed_qty = float(order.get('executedQty', 0))
-            avg_price = float(order.get('avgPrice', 0))
+            self.executed_orders[chunk_num - 1] = order
             
             logger.info(
-                f"Chunk {chunk_num} executed: "
-                f"Qty={executed_qty}, AvgPrice={avg_price}, "
-                f"OrderID={order['orderId']}"
+                "Chunk %d executed: Qty=%s, AvgPrice=%s, OrderID=%s",
+                chunk_num, order.get('executedQty'), order.get('avgPrice'), order['orderId']
             )
             
             return order
             
         except BinanceAPIException as e:
-            logger.error(f"Chunk {chunk_num} failed: {e}")
+            logger.error("Chunk %d failed: %s", chunk_num, e)
             self.failed_orders.append({
                 'chunk': chunk_num,
                 'error': str(e),
@@ -103,6 +140,156 @@ class TWAPExecutor:
             })
             raise
     
+    def execute_batch(self, chunk_nums: tuple) -> list:
+        """
+        Execute several chunks in one batchOrders request
+        
+        Args:
+            chunk_nums: Chunk numbers sent together (for logging)
+            
+        Returns:
+            list: Per chunk, either the order or a {code, msg} error
+        """
+        logger.info(
+            "Executing chunks %d-%d/%d: %s %s each",
+            chunk_nums[0], chunk_nums[-1], self.num_chunks, self.chunk_size, self.symbol
+        )
+        
+        try:
+            results = self.client.futures_place_batch_order(
+                batchOrders=ujson.dumps([self._order_params] * len(chunk_nums))
+            )
+        except Exception as e:
+            # The whole request failed (API error, 5xx, timeout): every chunk in it did
+            logger.error("Chunks %d-%d failed: %s", chunk_nums[0], chunk_nums[-1], e)
+            failed_at = datetime.now()
+            self.failed_orders.extend(
+                {'chunk': chunk_num, 'error': str(e), 'timestamp': failed_at}
+                for chunk_num in chunk_nums
+            )
+            raise
+        
+        failed_at = datetime.now()
+        for chunk_num, result in zip(chunk_nums, results):
+            if 'orderId' in result:
+                self.executed_orders[chunk_num - 1] = result
+                logger.info(
+                    "Chunk %d executed: Qty=%s, AvgPrice=%s, OrderID=%s",
+                    chunk_num, result.get('executedQty'), result.get('avgPrice'), result['orderId']
+                )
+            else:
+                logger.error("Chunk %d failed: %s", chunk_num, result.get('msg'))
+                self.failed_orders.append({
+                    'chunk': chunk_num,
+                    'error': result.get('msg'),
+                    'timestamp': failed_at
+                })
+        
+        return results
+    
+    def start_price_stream(self):
+        """Subscribe to the symbol's 1s mark-price stream"""
+        self.socket_manager = ThreadedWebsocketManager(
+            api_key=self.client.API_KEY,
+            api_secret=self.client.API_SECRET,
+            testnet=self.client.testnet
+        )
+        self.socket_manager.start()
+        self.socket_manager.start_futures_multiplex_socket(
+            callback=self.on_stream_message,
+            streams=[f"{self.symbol.lower()}@markPrice@1s"]
+        )
+        logger.info("Mark-price stream started")
+    
+    def stop_price_stream(self):
+        """Stop the mark-price stream"""
+        if self.socket_manager:
+            self.socket_manager.stop()
+            self.socket_manager = None
+            logger.info("Mark-price stream stopped")
+    
+    def on_stream_message(self, msg: dict):
+        """
+        Cache the latest mark price (runs on the websocket thread)
+        
+        Args:
+            msg: Combined-stream message
+        """
+        data = msg.get('data', msg)
+        if data.get('e') == 'markPriceUpdate':
+            self._last_price = float(data['p'])
+    
+    def _wait_for_slot(self, in_flight: dict, deadline: float) -> bool:
+        """
+        Report chunks that complete before the next chunk is due, then sleep
+        until it is
+        
+        Args:
+            in_flight: Pending futures mapped to their chunk numbers
+            deadline: time.monotonic() value at which the next chunk is due
+            
+        Returns:
+            bool: False if execution should stop after a failed chunk
+        """
+        while in_flight:
+            timeout = max(0, deadline - time.monotonic())
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if not self._report_slot(in_flight.pop(future), future, more_pending=True):
+                    return False
+        
+        wait_time = deadline - time.monotonic()
+        if wait_time > 0:
+            next_chunk_time = time.localtime(deadline + self._wall_offset)
+            print(f"\n⏳ Waiting {wait_time:.1f}s until next chunk...")
+            print(f"   Next execution at: {time.strftime('%H:%M:%S', next_chunk_time)}")
+            if self._last_price is not None:
+                print(f"   Mark price: {self._last_price}")
+            time.sleep(wait_time)
+        
+        return True
+    
+    def _report_slot(self, chunk_nums: tuple, future, more_pending: bool) -> bool:
+        """
+        Print the outcome of the chunks submitted in one slot
+        
+        Args:
+            chunk_nums: Chunk numbers submitted together
+            future: Completed future returned by execute_chunk or execute_batch
+            more_pending: Whether chunks remain to be submitted
+            
+        Returns:
+            bool: False if execution should stop after a failed chunk
+        """
+        try:
+            result = future.result()
+            results = result if isinstance(result, list) else [result]
+        except Exception as e:
+            results = [{'msg': str(e)}] * len(chunk_nums)
+        
+        failed = False
+        for chunk_num, order in zip(chunk_nums, results):
+            if 'orderId' not in order:
+                print(f"\n✗ Chunk {chunk_num}/{self.num_chunks} failed: {order.get('msg')}")
+                failed = True
+                continue
+            
+            print(f"\n✓ Chunk {chunk_num}/{self.num_chunks} executed")
+            print(f"  OrderID: {order['orderId']}")
+            print(f"  Quantity: {order.get('executedQty')}")
+            print(f"  Price: {order.get('avgPrice')}")
+        
+        if not (failed and more_pending) or self.on_failure == 'continue':
+            return True
+        if self.on_failure == 'abort':
+            return False
+        
+        # Ask user if they want to continue
+        response = input("\nContinue with remaining chunks? (y/n): ")
+        return response.lower() == 'y'
+    
     def calculate_statistics(self) -> dict:
         """
         Calculate execution statistics
@@ -110,22 +297,26 @@ class TWAPExecutor:
         Returns:
             dict: Execution statistics
         """
-        if not self.executed_orders:
+        executed = [o for o in self.executed_orders if o is not None]
+        if not executed:
             return {}
         
-        total_executed = sum(float(o.get('executedQty', 0)) for o in self.executed_orders)
+        # One pass over the responses, then vectorised sums
+        fills = np.fromiter(
+            ((float(o.get('executedQty', 0)), float(o.get('avgPrice', 0)))
+             for o in executed),
+            dtype=_FILL_DTYPE, count=len(executed)
+        )
+        total_executed = float(fills['qty'].sum())
         
         # Calculate weighted average price
-        total_cost = sum(
-            float(o.get('executedQty', 0)) * float(o.get('avgPrice', 0))
-            for o in self.executed_orders
-        )
+        total_cost = float(fills['qty'] @ fills['price'])
         avg_price = total_cost / total_executed if total_executed > 0 else 0
         
         return {
             'total_executed': total_executed,
             'average_price': avg_price,
-            'num_orders': len(self.executed_orders),
+            'num_orders': len(executed),
             'num_failed': len(self.failed_orders),
             'total_cost': total_cost if self.side == 'BUY' else 0,
             'total_proceeds': total_cost if self.side == 'SELL' else 0
@@ -135,21 +326,23 @@ class TWAPExecutor:
         """Execute TWAP strategy"""
         try:
             # Validation
-            logger.info("=" * 60)
-            logger.info("STARTING TWAP EXECUTION")
-            logger.info(f"Symbol: {self.symbol}")
-            logger.info(f"Side: {self.side}")
-            logger.info(f"Total Quantity: {self.total_quantity}")
-            logger.info(f"Chunks: {self.num_chunks}")
-            logger.info(f"Chunk Size: {self.chunk_size}")
-            logger.info(f"Interval: {self.interval_seconds}s")
-            logger.info("=" * 60)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(_SEP)
+                logger.info("STARTING TWAP EXECUTION")
+                logger.info("Symbol: %s", self.symbol)
+                logger.info("Side: %s", self.side)
+                logger.info("Total Quantity: %s", self.total_quantity)
+                logger.info("Chunks: %d", self.num_chunks)
+                logger.info("Chunk Size: %s", self.chunk_size)
+                logger.info("Interval: %ss", self.interval_seconds)
+                logger.info(_SEP)
             
             self.validate()
             
             # Check balance
             balance = check_balance(self.client, 'USDT')
             current_price = get_current_price(self.client, self.symbol)
+            self._last_price = current_price
             estimated_cost = self.total_quantity * current_price
             
             if self.side == 'BUY' and estimated_cost > balance:
@@ -168,52 +361,60 @@ class TWAPExecutor:
             print(f"Number of Chunks: {self.num_chunks}")
             print(f"Chunk Size: {self.chunk_size}")
             print(f"Interval: {self.interval_seconds} seconds")
+            if not self.interval_seconds:
+                print(f"Batch Size: {self.batch_size} orders per request")
             print(f"Total Duration: ~{self.num_chunks * self.interval_seconds / 60:.1f} minutes")
             print(f"Current Price: {current_price}")
             print(f"Estimated Cost: {estimated_cost:.2f} USDT" if self.side == 'BUY' else '')
             print("=" * 60)
             
-            input("\nPress ENTER to start execution (or Ctrl+C to cancel)...")
+            if self.confirm:
+                input("\nPress ENTER to start execution (or Ctrl+C to cancel)...")
+            
+            # Waits between chunks show the streamed price instead of polling
+            if self.interval_seconds:
+                self.start_price_stream()
             
-            start_time = datetime.now()
+            # With no interval all chunks are due at once, so they share
+            # batchOrders requests; otherwise each chunk has its own slot
+            chunk_nums = tuple(range(1, self.num_chunks + 1))
+            per_slot = self.batch_size if not self.interval_seconds else 1
+            slots = [chunk_nums[i:i + per_slot] for i in range(0, self.num_chunks, per_slot)]
             
-            # Execute chunks
-            for chunk_num in range(1, self.num_chunks + 1):
-                chunk_start = datetime.now()
+            # Absolute monotonic deadlines, so sleeps never accumulate drift
+            start = time.monotonic()
+            self._wall_offset = time.time() - start  # maps deadlines to wall-clock times
+            self.deadlines = start + np.arange(len(slots)) * self.interval_seconds
+            
+            # Orders go out on worker threads at their scheduled times, so a
+            # slow response never delays the next chunk; results are reported
+            # here as they arrive
+            with ThreadPoolExecutor(max_workers=MAX_CHUNKS_IN_FLIGHT) as pool:
+                in_flight = {}
                 
-                try:
-                    order = self.execute_chunk(chunk_num)
-                    
-                    print(f"\n✓ Chunk {chunk_num}/{self.num_chunks} executed")
-                    print(f"  OrderID: {order['orderId']}")
-                    print(f"  Quantity: {order.get('executedQty')}")
-                    print(f"  Price: {order.get('avgPrice')}")
-                    
-                except Exception as e:
-                    print(f"\n✗ Chunk {chunk_num}/{self.num_chunks} failed: {e}")
-                    
-                    # Ask user if they want to continue
-                    if chunk_num < self.num_chunks:
-                        response = input("\nContinue with remaining chunks? (y/n): ")
-                        if response.lower() != 'y':
-                            logger.info("TWAP execution cancelled by user")
-                            break
+                # Loop-invariant lookups bound once as locals
+                submit = pool.submit
+                deadlines = self.deadlines
+                wait_for_slot = self._wait_for_slot
+                execute_chunk = self.execute_chunk
+                execute_batch = self.execute_batch
                 
-                # Wait for next interval (except for last chunk)
-                if chunk_num < self.num_chunks:
-                    # Calculate actual wait time to maintain intervals
-                    elapsed = (datetime.now() - chunk_start).total_seconds()
-                    wait_time = max(0, self.interval_seconds - elapsed)
+                for slot_num, slot in enumerate(slots):
+                    if slot_num and not wait_for_slot(in_flight, deadlines[slot_num]):
+                        logger.info("TWAP execution stopped after a failed chunk")
+                        break
                     
-                    if wait_time > 0:
-                        next_chunk_time = datetime.now() + timedelta(seconds=wait_time)
-                        print(f"\n⏳ Waiting {wait_time:.1f}s until next chunk...")
-                        print(f"   Next execution at: {next_chunk_time.strftime('%H:%M:%S')}")
-                        time.sleep(wait_time)
+                    if len(slot) > 1:
+                        future = submit(execute_batch, slot)
+                    else:
+                        future = submit(execute_chunk, slot[0])
+                    in_flight[future] = slot
+                
+                for future in sorted(in_flight, key=in_flight.get):
+                    self._report_slot(in_flight[future], future, more_pending=False)
             
             # Calculate and display statistics
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.monotonic() - start
             stats = self.calculate_statistics()
             
             print("\n" + "=" * 60)
@@ -233,19 +434,23 @@ class TWAPExecutor:
             print("=" * 60)
             
             logger.info("TWAP execution completed successfully")
-            logger.info(f"Statistics: {stats}")
+            logger.info("Statistics: %s", stats)
             
             return stats
             
         except KeyboardInterrupt:
             logger.info("TWAP execution interrupted by user")
             print("\n\n✗ Execution cancelled by user")
-            print(f"\nPartial execution: {len(self.executed_orders)}/{self.num_chunks} chunks completed")
+            completed = self.num_chunks - self.executed_orders.count(None)
+            print(f"\nPartial execution: {completed}/{self.num_chunks} chunks completed")
             raise
             
         except Exception as e:
-            logger.error(f"TWAP execution failed: {e}", exc_info=True)
+            logger.error("TWAP execution failed: %s", e, exc_info=True)
             raise
+        
+        finally:
+            self.stop_price_stream()
 
 def main():
     """CLI entry point for TWAP strategy"""
@@ -255,10 +460,13 @@ def main():
         epilog="""
 Examples:
   # Buy 1 BTC split into 10 orders over 60 minutes
-  python twap.py BTCUSDT BUY 1.0 --chunks 10 --duration 60
+  python -m src.advanced.twap BTCUSDT BUY 1.0 --chunks 10 --duration 60
 
   # Sell 0.5 BTC split into 5 orders with 120s intervals
-  python twap.py ETHUSDT SELL 0.5 --chunks 5 --interval 120
+  python -m src.advanced.twap ETHUSDT SELL 0.5 --chunks 5 --interval 120
+
+  # Slice 1 BTC into 10 orders sent immediately, 5 per request
+  python -m src.advanced.twap BTCUSDT BUY 1.0 --chunks 10 --interval 0
         """
     )
     
@@ -270,14 +478,20 @@ Examples:
     parser.add_argument('--duration', type=float, default=None,
                        help='Total duration in minutes')
     parser.add_argument('--interval', type=int, default=None,
-                       help='Interval between chunks in seconds')
+                       help='Interval between chunks in seconds (0 sends all at once)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_ORDER_LIMIT,
+                       help=f'Chunks per request when --interval is 0 (max {BATCH_ORDER_LIMIT})')
+    parser.add_argument('--yes', action='store_true',
+                       help='Start without the confirmation prompt')
+    parser.add_argument('--on-failure', choices=ON_FAILURE_POLICIES, default='ask',
+                       help='After a failed chunk: ask, continue or abort (default: ask)')
     
     args = parser.parse_args()
     
     # Calculate interval
-    if args.duration and not args.interval:
+    if args.duration and args.interval is None:
         args.interval = int((args.duration * 60) / args.chunks)
-    elif not args.interval:
+    elif args.interval is None:
         args.interval = 60  # Default 60 seconds
     
     # Validation
@@ -289,19 +503,24 @@ Examples:
         print("✗ Error: Number of chunks must be positive")
         sys.exit(1)
     
-    if args.interval <= 0:
-        print("✗ Error: Interval must be positive")
+    if args.interval < 0:
+        print("✗ Error: Interval cannot be negative")
         sys.exit(1)
     
+    setup_logging()
+    
     try:
         client = get_client()
         executor = TWAPExecutor(
             client=client,
-            symbol=args.symbol.upper(),
-            side=args.side.upper(),
+            symbol=sys.intern(args.symbol.upper()),
+            side=sys.intern(args.side.upper()),
             total_quantity=args.quantity,
             num_chunks=args.chunks,
-            interval_seconds=args.interval
+            interval_seconds=args.interval,
+            batch_size=args.batch_size,
+            confirm=not args.yes,
+            on_failure=args.on_failure
         )
         
         executor.run()
@@ -311,7 +530,7 @@ Examples:
         sys.exit(0)
         
     except Exception as e:
-        logger.error(f"TWAP failed: {e}")
+        logger.error("TWAP failed: %s", e)
         print(f"\n✗ Error: {e}")
         sys.exit(1)
 
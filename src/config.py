@@ -1,13 +1,25 @@
 """
 Configuration module for Binance Futures Trading Bot
 Handles API credentials, logging setup, and global settings
+
+Signed requests are stamped with the local clock plus an offset that is
+refreshed in the background every TIME_SYNC_INTERVAL seconds, so orders never
+wait on a server-time request. Keep the host clock NTP-synced; drift beyond
+recvWindow between refreshes is rejected by Binance (error -1021).
 """
 
 import os
+import time
+import queue
+import atexit
 import logging
+import functools
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+
+import ujson
 from dotenv import load_dotenv
-from binance.client import Client
 
 # Load environment variables
 load_dotenv()
@@ -20,6 +32,12 @@ TESTNET = os.getenv('TESTNET', 'True').lower() == 'true'
 # Binance Client Configuration
 TESTNET_URL = 'https://testnet.binancefuture.com'
 
+# Skip the console summary after each order (headless bots)
+QUIET = os.getenv('QUIET', '0') == '1'
+
+# Submit fixed-shape orders through pre-built signed requests (src/advanced/_fast_order.py)
+FAST_PATH = os.getenv('FAST_PATH', '0') == '1'
+
 # Trading Parameters
 DEFAULT_LEVERAGE = 1
 POSITION_MODE = 'One-way'  # or 'Hedge'
@@ -31,39 +49,78 @@ LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# exchangeInfo persisted between runs (see utils.get_exchange_info)
+EXCHANGE_INFO_CACHE_FILE = LOG_DIR / f".exchange_info_{'testnet' if TESTNET else 'live'}.json"
+EXCHANGE_INFO_CACHE_TTL = 60 * 60  # seconds a cached file is trusted by a new process
+
 # API Settings
 MAX_RETRIES = 3
+RETRY_BACKOFF = 0.1  # seconds, doubled on each retry
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+# Methods safe to resend after a response; an order POST may already have been
+# accepted, so it is only retried when the connection itself failed
+RETRY_METHODS = frozenset({'GET', 'PUT', 'DELETE'})
 TIMEOUT = 10
 RATE_LIMIT_BUFFER = 0.1  # seconds between requests
 
+# HTTP connection pooling (connections are kept alive and reused)
+HTTP_POOL_CONNECTIONS = 4  # hosts to keep pools for
+HTTP_POOL_MAXSIZE = 16  # persistent connections per host
+KEEPALIVE_PING_INTERVAL = 30  # seconds between pings that keep connections warm
+LISTEN_KEY_KEEPALIVE = 30 * 60  # user-data listenKeys expire after 60 minutes
+TIME_SYNC_INTERVAL = 5 * 60  # seconds between server-time offset refreshes
+
+# Background thread doing the log I/O; set by setup_logging
+log_listener = None
+
 # Order Validation
 MIN_NOTIONAL = 5  # Minimum order value in USDT
 MAX_POSITION_SIZE = 100000  # Maximum position size in USDT
 
 def setup_logging():
-    """Configure logging for the entire application"""
-    logging.basicConfig(
-        level=getattr(logging, LOG_LEVEL),
-        format=LOG_FORMAT,
-        datefmt=DATE_FORMAT,
-        handlers=[
+    """
+    Configure logging for the entire application
+    
+    Called by each CLI entry point once its arguments are parsed, so importing
+    the package and --help never open bot.log. Log calls only enqueue the
+    record; a background listener formats it and does the file and console I/O.
+    """
+    global log_listener
+    root = logging.getLogger()
+    
+    if not root.handlers:
+        formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+        handlers = [
             logging.FileHandler(LOG_FILE, encoding='utf-8'),
             logging.StreamHandler()
         ]
-    )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        log_listener.start()
+        atexit.register(log_listener.stop)  # drains pending records on exit
+        
+        root.setLevel(getattr(logging, LOG_LEVEL))
+        root.addHandler(QueueHandler(log_queue))
     
     logger = logging.getLogger(__name__)
     logger.info("=" * 60)
     logger.info("Binance Futures Trading Bot Started")
-    logger.info(f"Mode: {'TESTNET' if TESTNET else 'PRODUCTION'}")
+    logger.info("Mode: %s", 'TESTNET' if TESTNET else 'PRODUCTION')
     logger.info("=" * 60)
     
     return logger
 
+@functools.lru_cache(maxsize=1)
 def get_client():
     """
     Initialize and return Binance Futures client
     
+    The client is created once per process and shared, so every order reuses
+    the same session, connection pool and keep-alive thread.
+    
     Returns:
         Client: Configured Binance client instance
         
@@ -76,16 +133,99 @@ def get_client():
             "BINANCE_API_SECRET in .env file"
         )
     
+    # Deferred so importing config doesn't load the Binance SDK
+    from binance.client import Client
+    from binance.exceptions import BinanceAPIException, BinanceRequestException
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    def handle_response(response):
+        # Same contract as Client._handle_response, parsed with ujson
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+        try:
+            return ujson.loads(response.content)
+        except ValueError:
+            raise BinanceRequestException(f"Invalid Response: {response.text}")
+    
     client = Client(API_KEY, API_SECRET, testnet=TESTNET)
+    client._handle_response = handle_response
+    
+    # Retry transient failures in the transport, honouring Retry-After on 429
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    
+    # Size the pool so concurrent requests reuse warm TCP/TLS connections
+    client.session.mount('https://', HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        pool_block=False,
+        max_retries=retry
+    ))
+    client.session.headers['Connection'] = 'keep-alive'
     
     if TESTNET:
         client.API_URL = TESTNET_URL
     
     logger = logging.getLogger(__name__)
-    logger.info(f"Client initialized - Testnet: {TESTNET}")
+    
+    # Pay the futures TCP/TLS handshake here rather than on the first order
+    try:
+        client.futures_ping()
+    except Exception as e:
+        logger.debug("Warm-up ping failed: %s", e)
+    
+    threading.Thread(
+        target=_keep_connection_warm, args=(client,),
+        name='binance-keepalive', daemon=True
+    ).start()
+    
+    logger.info("Client initialized - Testnet: %s", TESTNET)
     
     return client
 
+def _keep_connection_warm(client):
+    """
+    Ping the futures API periodically so the pooled connection isn't idled out
+    
+    Every TIME_SYNC_INTERVAL seconds the ping is replaced by a server-time
+    request that refreshes client.timestamp_offset.
+    
+    Args:
+        client: Binance client instance
+    """
+    next_sync = 0.0
+    while True:
+        try:
+            if time.monotonic() >= next_sync:
+                _sync_timestamp_offset(client)
+                next_sync = time.monotonic() + TIME_SYNC_INTERVAL
+            else:
+                client.futures_ping()
+        except Exception as e:
+            logging.getLogger(__name__).debug("Keep-alive ping failed: %s", e)
+        time.sleep(KEEPALIVE_PING_INTERVAL)
+
+def _sync_timestamp_offset(client):
+    """
+    Set the client's timestamp offset from the futures server time
+    
+    Args:
+        client: Binance client instance
+    """
+    sent = time.time()
+    server_time = client.futures_time()['serverTime']
+    received = time.time()
+    
+    # Assume the server read its clock halfway through the round trip
+    client.timestamp_offset = server_time - int((sent + received) * 500)
+
 def validate_environment():
     """
     Validate that all required environment variables are set
@@ -107,15 +247,12 @@ def validate_environment():
     
     return True
 
-# Initialize logger on import
-logger = setup_logging()
-
 # Trading pairs configuration
-SUPPORTED_SYMBOLS = [
+SUPPORTED_SYMBOLS = frozenset({
     'BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'ADAUSDT', 'DOGEUSDT',
     'XRPUSDT', 'DOTUSDT', 'UNIUSDT', 'LINKUSDT', 'LTCUSDT',
     'SOLUSDT', 'MATICUSDT', 'AVAXUSDT', 'ATOMUSDT'
-]
+})
 
 # Price precision for major symbols
 PRICE_PRECISION = {
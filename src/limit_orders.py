@@ -5,16 +5,22 @@ Places orders at specific price levels
 
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
 from binance.exceptions import BinanceAPIException
-from config import get_client, setup_logging
-from utils import (
-    validate_symbol, validate_quantity, validate_price, validate_side,
+from src.config import get_client, setup_logging, HTTP_POOL_MAXSIZE
+from src.utils import (
+    validate_order, validate_side,
     check_balance, format_order_response, get_current_price, 
-    validate_notional, ValidationError
+    ValidationError
 )
 
 logger = logging.getLogger(__name__)
 
+# Separator line, built once at import
+_SEP = "=" * 60
+
 def place_limit_order(symbol: str, side: str, quantity: float, price: float, 
                       time_in_force: str = 'GTC') -> dict:
     """
@@ -39,25 +45,20 @@ def place_limit_order(symbol: str, side: str, quantity: float, price: float,
         client = get_client()
         
         # Validate inputs
-        logger.info(f"Validating limit order: {side} {quantity} {symbol} @ {price}")
+        logger.info("Validating limit order: %s %s %s @ %s", side, quantity, symbol, price)
         side = validate_side(side)
-        validate_symbol(client, symbol)
-        quantity = validate_quantity(client, symbol, quantity)
-        price = validate_price(client, symbol, price)
-        
-        # Validate notional value
-        validate_notional(client, symbol, quantity, price)
+        quantity, price = validate_order(client, symbol, quantity, price)
         
         # Get current market price for comparison
         current_price = get_current_price(client, symbol)
-        logger.info(f"Current market price: {current_price}")
+        logger.info("Current market price: %s", current_price)
         
         # Warn if limit price is far from market
         price_diff_pct = abs((price - current_price) / current_price * 100)
         if price_diff_pct > 5:
             logger.warning(
-                f"Limit price {price} is {price_diff_pct:.2f}% away from "
-                f"market price {current_price}"
+                "Limit price %s is %.2f%% away from market price %s",
+                price, price_diff_pct, current_price
             )
         
         # Check balance
@@ -70,10 +71,10 @@ def place_limit_order(symbol: str, side: str, quantity: float, price: float,
                 f"Available: {balance:.2f} USDT"
             )
         
-        logger.info(f"Available balance: {balance:.2f} USDT")
+        logger.info("Available balance: %.2f USDT", balance)
         
         # Place limit order
-        logger.info(f"Placing limit order: {side} {quantity} {symbol} @ {price}")
+        logger.info("Placing limit order: %s %s %s @ %s", side, quantity, symbol, price)
         
         order = client.futures_create_order(
             symbol=symbol,
@@ -85,8 +86,9 @@ def place_limit_order(symbol: str, side: str, quantity: float, price: float,
         )
         
         # Log success
-        logger.info(f"Limit order placed successfully!")
-        logger.info(format_order_response(order))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Limit order placed successfully!")
+            logger.info(format_order_response(order))
         
         # Print to console
         print("\n✓ Limit Order Placed Successfully!")
@@ -98,17 +100,17 @@ def place_limit_order(symbol: str, side: str, quantity: float, price: float,
         return order
         
     except ValidationError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         print(f"\n✗ Validation Error: {e}")
         raise
         
     except BinanceAPIException as e:
-        logger.error(f"Binance API error: {e}")
+        logger.error("Binance API error: %s", e)
         print(f"\n✗ Order Failed: {e}")
         raise
         
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         print(f"\n✗ Unexpected Error: {e}")
         raise
 
@@ -127,11 +129,11 @@ def check_order_status(order_id: int, symbol: str) -> dict:
         client = get_client()
         order = client.futures_get_order(symbol=symbol, orderId=order_id)
         
-        logger.info(f"Order status: {order['status']}")
+        logger.info("Order status: %s", order['status'])
         return order
         
     except BinanceAPIException as e:
-        logger.error(f"Failed to get order status: {e}")
+        logger.error("Failed to get order status: %s", e)
         raise
 
 def cancel_limit_order(order_id: int, symbol: str) -> dict:
@@ -149,32 +151,77 @@ def cancel_limit_order(order_id: int, symbol: str) -> dict:
         client = get_client()
         result = client.futures_cancel_order(symbol=symbol, orderId=order_id)
         
-        logger.info(f"Order {order_id} cancelled successfully")
+        logger.info("Order %s cancelled successfully", order_id)
         print(f"\n✓ Order {order_id} cancelled successfully")
         
         return result
         
     except BinanceAPIException as e:
-        logger.error(f"Failed to cancel order: {e}")
+        logger.error("Failed to cancel order: %s", e)
         print(f"\n✗ Cancellation Failed: {e}")
         raise
 
+def place_limit_orders(orders: List[Tuple[str, str, float, float]],
+                       time_in_force: str = 'GTC') -> List[dict]:
+    """
+    Place several limit orders at once on the shared client
+    
+    Every order is validated before any is sent; the requests then go out
+    concurrently over the client's connection pool.
+    
+    Args:
+        orders: (symbol, side, quantity, price) per order
+        time_in_force: Order time in force (GTC, IOC, FOK) for all orders
+        
+    Returns:
+        list: Per order, in input order, the order response or a {msg} error
+        
+    Raises:
+        ValidationError: If any order fails validation
+    """
+    client = get_client()
+    
+    params = []
+    for symbol, side, quantity, price in orders:
+        side = validate_side(side)
+        quantity, price = validate_order(client, symbol, quantity, price)
+        params.append({
+            'symbol': symbol,
+            'side': side,
+            'type': 'LIMIT',
+            'timeInForce': time_in_force,
+            'quantity': quantity,
+            'price': price
+        })
+    
+    def submit(order_params: dict) -> dict:
+        try:
+            return client.futures_create_order(**order_params)
+        except BinanceAPIException as e:
+            logger.error("Limit order failed: %s %s @ %s: %s", order_params['side'],
+                         order_params['symbol'], order_params['price'], e)
+            return {'msg': str(e)}
+    
+    logger.info("Placing %d limit orders", len(params))
+    with ThreadPoolExecutor(max_workers=min(len(params), HTTP_POOL_MAXSIZE) or 1) as pool:
+        return list(pool.map(submit, params))
+
 def main():
     """
     CLI entry point for limit orders
     
     Usage:
-        python limit_orders.py SYMBOL SIDE QUANTITY PRICE [TIME_IN_FORCE]
+        python -m src.limit_orders SYMBOL SIDE QUANTITY PRICE [TIME_IN_FORCE]
         
     Examples:
-        python limit_orders.py BTCUSDT BUY 0.01 50000
-        python limit_orders.py ETHUSDT SELL 0.1 3000 IOC
+        python -m src.limit_orders BTCUSDT BUY 0.01 50000
+        python -m src.limit_orders ETHUSDT SELL 0.1 3000 IOC
     """
     if len(sys.argv) < 5:
-        print("\nUsage: python limit_orders.py SYMBOL SIDE QUANTITY PRICE [TIME_IN_FORCE]")
+        print("\nUsage: python -m src.limit_orders SYMBOL SIDE QUANTITY PRICE [TIME_IN_FORCE]")
         print("\nExamples:")
-        print("  python limit_orders.py BTCUSDT BUY 0.01 50000")
-        print("  python limit_orders.py ETHUSDT SELL 0.1 3000 IOC")
+        print("  python -m src.limit_orders BTCUSDT BUY 0.01 50000")
+        print("  python -m src.limit_orders ETHUSDT SELL 0.1 3000 IOC")
         print("\nArguments:")
         print("  SYMBOL        - Trading pair (e.g., BTCUSDT)")
         print("  SIDE          - BUY or SELL")
@@ -187,8 +234,9 @@ def main():
         print("  FOK - Fill or Kill")
         sys.exit(1)
     
-    symbol = sys.argv[1].upper()
-    side = sys.argv[2].upper()
+    # Normalised once here; interned since they key the filter/price caches
+    symbol = sys.intern(sys.argv[1].upper())
+    side = sys.intern(sys.argv[2].upper())
     time_in_force = sys.argv[5].upper() if len(sys.argv) > 5 else 'GTC'
     
     try:
@@ -202,12 +250,18 @@ def main():
         print(f"\n✗ Invalid input: {e}")
         sys.exit(1)
     
+    setup_logging()
+    
     try:
-        logger.info("=" * 60)
-        logger.info("LIMIT ORDER REQUEST")
-        logger.info(f"Symbol: {symbol} | Side: {side} | Quantity: {quantity} | Price: {price}")
-        logger.info(f"Time In Force: {time_in_force}")
-        logger.info("=" * 60)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_SEP)
+            logger.info("LIMIT ORDER REQUEST")
+            logger.info(
+                "Symbol: %s | Side: %s | Quantity: %s | Price: %s",
+                symbol, side, quantity, price
+            )
+            logger.info("Time In Force: %s", time_in_force)
+            logger.info(_SEP)
         
         place_limit_order(symbol, side, quantity, price, time_in_force)
         
@@ -217,7 +271,7 @@ def main():
         sys.exit(0)
         
     except Exception as e:
-        logger.error(f"Limit order failed: {e}")
+        logger.error("Limit order failed: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -5,15 +5,21 @@ Executes immediate buy/sell orders at current market price
 
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
 from binance.exceptions import BinanceAPIException
-from config import get_client, setup_logging
-from utils import (
-    validate_symbol, validate_quantity, validate_side,
+from src.config import get_client, setup_logging, HTTP_POOL_MAXSIZE
+from src.utils import (
+    validate_order, validate_side,
     check_balance, format_order_response, ValidationError
 )
 
 logger = logging.getLogger(__name__)
 
+# Separator line, built once at import
+_SEP = "=" * 60
+
 def place_market_order(symbol: str, side: str, quantity: float) -> dict:
     """
     Place a market order on Binance Futures
@@ -35,17 +41,16 @@ def place_market_order(symbol: str, side: str, quantity: float) -> dict:
         client = get_client()
         
         # Validate inputs
-        logger.info(f"Validating market order: {side} {quantity} {symbol}")
+        logger.info("Validating market order: %s %s %s", side, quantity, symbol)
         side = validate_side(side)
-        validate_symbol(client, symbol)
-        quantity = validate_quantity(client, symbol, quantity)
+        quantity, _ = validate_order(client, symbol, quantity)
         
         # Check balance
         balance = check_balance(client, 'USDT')
-        logger.info(f"Available balance: {balance:.2f} USDT")
+        logger.info("Available balance: %.2f USDT", balance)
         
         # Place market order
-        logger.info(f"Placing market order: {side} {quantity} {symbol}")
+        logger.info("Placing market order: %s %s %s", side, quantity, symbol)
         
         order = client.futures_create_order(
             symbol=symbol,
@@ -55,8 +60,9 @@ def place_market_order(symbol: str, side: str, quantity: float) -> dict:
         )
         
         # Log success
-        logger.info(f"Market order placed successfully!")
-        logger.info(format_order_response(order))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Market order placed successfully!")
+            logger.info(format_order_response(order))
         
         # Print to console
         print("\n✓ Market Order Executed Successfully!")
@@ -65,44 +71,81 @@ def place_market_order(symbol: str, side: str, quantity: float) -> dict:
         return order
         
     except ValidationError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         print(f"\n✗ Validation Error: {e}")
         raise
         
     except BinanceAPIException as e:
-        logger.error(f"Binance API error: {e}")
+        logger.error("Binance API error: %s", e)
         print(f"\n✗ Order Failed: {e}")
         raise
         
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         print(f"\n✗ Unexpected Error: {e}")
         raise
 
+def place_market_orders(orders: List[Tuple[str, str, float]]) -> List[dict]:
+    """
+    Place several market orders at once on the shared client
+    
+    Every order is validated before any is sent; the requests then go out
+    concurrently over the client's connection pool.
+    
+    Args:
+        orders: (symbol, side, quantity) per order
+        
+    Returns:
+        list: Per order, in input order, the order response or a {msg} error
+        
+    Raises:
+        ValidationError: If any order fails validation
+    """
+    client = get_client()
+    
+    params = []
+    for symbol, side, quantity in orders:
+        side = validate_side(side)
+        quantity, _ = validate_order(client, symbol, quantity)
+        params.append({'symbol': symbol, 'side': side, 'type': 'MARKET', 'quantity': quantity})
+    
+    def submit(order_params: dict) -> dict:
+        try:
+            return client.futures_create_order(**order_params)
+        except BinanceAPIException as e:
+            logger.error("Market order failed: %s %s: %s",
+                         order_params['side'], order_params['symbol'], e)
+            return {'msg': str(e)}
+    
+    logger.info("Placing %d market orders", len(params))
+    with ThreadPoolExecutor(max_workers=min(len(params), HTTP_POOL_MAXSIZE) or 1) as pool:
+        return list(pool.map(submit, params))
+
 def main():
     """
     CLI entry point for market orders
     
     Usage:
-        python market_orders.py SYMBOL SIDE QUANTITY
+        python -m src.market_orders SYMBOL SIDE QUANTITY
         
     Examples:
-        python market_orders.py BTCUSDT BUY 0.01
-        python market_orders.py ETHUSDT SELL 0.1
+        python -m src.market_orders BTCUSDT BUY 0.01
+        python -m src.market_orders ETHUSDT SELL 0.1
     """
     if len(sys.argv) != 4:
-        print("\nUsage: python market_orders.py SYMBOL SIDE QUANTITY")
+        print("\nUsage: python -m src.market_orders SYMBOL SIDE QUANTITY")
         print("\nExamples:")
-        print("  python market_orders.py BTCUSDT BUY 0.01")
-        print("  python market_orders.py ETHUSDT SELL 0.1")
+        print("  python -m src.market_orders BTCUSDT BUY 0.01")
+        print("  python -m src.market_orders ETHUSDT SELL 0.1")
         print("\nArguments:")
         print("  SYMBOL   - Trading pair (e.g., BTCUSDT)")
         print("  SIDE     - BUY or SELL")
         print("  QUANTITY - Amount to trade")
         sys.exit(1)
     
-    symbol = sys.argv[1].upper()
-    side = sys.argv[2].upper()
+    # Normalised once here; interned since they key the filter/price caches
+    symbol = sys.intern(sys.argv[1].upper())
+    side = sys.intern(sys.argv[2].upper())
     
     try:
         quantity = float(sys.argv[3])
@@ -112,11 +155,14 @@ def main():
         print(f"\n✗ Invalid quantity: {e}")
         sys.exit(1)
     
+    setup_logging()
+    
     try:
-        logger.info("=" * 60)
-        logger.info("MARKET ORDER REQUEST")
-        logger.info(f"Symbol: {symbol} | Side: {side} | Quantity: {quantity}")
-        logger.info("=" * 60)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_SEP)
+            logger.info("MARKET ORDER REQUEST")
+            logger.info("Symbol: %s | Side: %s | Quantity: %s", symbol, side, quantity)
+            logger.info(_SEP)
         
         place_market_order(symbol, side, quantity)
         
@@ -126,7 +172,7 @@ def main():
         sys.exit(0)
         
     except Exception as e:
-        logger.error(f"Market order failed: {e}")
+        logger.error("Market order failed: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
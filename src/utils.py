@@ -3,23 +3,173 @@ Utility functions and validators for Binance Futures Trading Bot
 Includes input validation, formatting, and helper functions
 """
 
+import os
 import logging
+import threading
 import time
+import random
+import functools
+import tempfile
 from decimal import Decimal, ROUND_DOWN
-from typing import Optional, Dict, Any
+from typing import Optional, Callable, Dict, Any, Iterable, List, Tuple
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError, ConnectTimeout, Timeout
+)
+
+import ujson
+
+from src.config import EXCHANGE_INFO_CACHE_FILE, EXCHANGE_INFO_CACHE_TTL
 
 logger = logging.getLogger(__name__)
 
-class ValidationError(Exception):
+# Seconds a fetched exchangeInfo response is reused before refetching
+EXCHANGE_INFO_TTL = 300
+
+# client -> (fetched_at, exchangeInfo response, symbol -> symbol info,
+#           symbol -> parsed filter limits)
+_exchange_info_cache: Dict[Client, tuple] = {}
+
+# Serialises refetches so concurrent validators share one request
+_exchange_info_lock = threading.Lock()
+
+# Symbols that passed validate_symbol since the last exchangeInfo fetch
+_validated_symbols = set()
+
+# Seconds a fetched price / balance is reused by back-to-back orders
+PRICE_TTL = 0.5
+BALANCE_TTL = 5.0
+
+# Longest retry_on_failure waits between attempts, in seconds; a longer
+# Retry-After (e.g. an IP ban) fails immediately instead
+RETRY_DELAY_CAP = 30.0
+
+# (client, symbol) -> (fetched_at, price)
+_price_cache: Dict[tuple, tuple] = {}
+
+# client -> (fetched_at, asset -> futures account asset entry)
+_account_cache: Dict[Client, tuple] = {}
+
+# Serialises account refetches, like _exchange_info_lock
+_account_lock = threading.Lock()
+
+# Order sides accepted by validate_side
+_VALID_SIDES = frozenset({'BUY', 'SELL'})
+
+class ValidationError(ValueError):
     """Custom exception for validation errors"""
     pass
 
+def get_exchange_info(client: Client, ttl: float = EXCHANGE_INFO_TTL) -> Dict[str, Any]:
+    """
+    Get futures exchangeInfo, refetching at most once every ttl seconds
+    
+    A new process starts from the copy saved in EXCHANGE_INFO_CACHE_FILE when
+    it is younger than EXCHANGE_INFO_CACHE_TTL, skipping the initial fetch.
+    Safe to call from several threads; only one of them refetches.
+    
+    Args:
+        client: Binance client instance
+        ttl: Seconds a fetched response is reused
+        
+    Returns:
+        dict: exchangeInfo response; shared, do not modify
+    """
+    return _get_exchange_info_entry(client, ttl)[1]
+
+def _get_symbols_by_name(client: Client) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the current exchangeInfo's symbols keyed by name
+    
+    Args:
+        client: Binance client instance
+        
+    Returns:
+        dict: Symbol name -> symbol info; shared, do not modify
+    """
+    return _get_exchange_info_entry(client, EXCHANGE_INFO_TTL)[2]
+
+def _get_exchange_info_entry(client: Client, ttl: float) -> tuple:
+    """Return the (fetched_at, exchangeInfo, symbols, limits) cache entry, refetching once stale"""
+    cached = _exchange_info_cache.get(client)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached
+    
+    with _exchange_info_lock:
+        # Another thread may have refetched while this one waited
+        now = time.monotonic()
+        cached = _exchange_info_cache.get(client)
+        if cached and now - cached[0] < ttl:
+            return cached
+        
+        exchange_info = None if cached else _load_exchange_info_file()
+        if exchange_info is None:
+            exchange_info = client.futures_exchange_info()
+            _save_exchange_info_file(exchange_info)
+        
+        # Indexed and parsed once per fetch so validators never touch the raw strings
+        symbols_by_name = {s['symbol']: s for s in exchange_info['symbols']}
+        limits_by_symbol = {
+            name: parse_symbol_limits(s['filters'])
+            for name, s in symbols_by_name.items()
+        }
+        entry = (now, exchange_info, symbols_by_name, limits_by_symbol)
+        _exchange_info_cache[client] = entry
+        # Recheck symbol status against the new response
+        _validated_symbols.clear()
+    
+    return entry
+
+def _load_exchange_info_file() -> Optional[Dict[str, Any]]:
+    """
+    Read exchangeInfo saved by a previous run
+    
+    Returns:
+        dict: exchangeInfo response, or None if the file is missing, stale or unreadable
+    """
+    try:
+        if time.time() - os.path.getmtime(EXCHANGE_INFO_CACHE_FILE) >= EXCHANGE_INFO_CACHE_TTL:
+            return None
+        with open(EXCHANGE_INFO_CACHE_FILE, 'rb') as f:
+            return ujson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _save_exchange_info_file(exchange_info: Dict[str, Any]):
+    """
+    Save exchangeInfo for later runs; failures only cost the next run a fetch
+    
+    Args:
+        exchange_info: exchangeInfo response
+    """
+    # A unique temp file per writer, so concurrent runs never interleave
+    # writes; os.replace then swaps in one complete file
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=EXCHANGE_INFO_CACHE_FILE.parent,
+            prefix=EXCHANGE_INFO_CACHE_FILE.name + '.', suffix='.tmp', delete=False
+        ) as f:
+            tmp_path = f.name
+            f.write(ujson.dumps(exchange_info))
+        os.replace(tmp_path, EXCHANGE_INFO_CACHE_FILE)
+    except OSError as e:
+        logger.debug("Could not save exchangeInfo cache: %s", e)
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
 def validate_symbol(client: Client, symbol: str) -> bool:
     """
     Validate that symbol exists and is tradeable
     
+    A symbol that already passed is accepted without consulting exchangeInfo
+    again, even once the cached copy is stale, until some other lookup
+    refetches it.
+    
     Args:
         client: Binance client instance
         symbol: Trading pair symbol (e.g., 'BTCUSDT')
@@ -30,28 +180,77 @@ def validate_symbol(client: Client, symbol: str) -> bool:
     Raises:
         ValidationError: If symbol is invalid
     """
+    if symbol in _validated_symbols:
+        return True
+    
     try:
-        exchange_info = client.futures_exchange_info()
-        symbols = [s['symbol'] for s in exchange_info['symbols']]
+        symbol_info = _get_symbols_by_name(client).get(symbol)
+    except BinanceAPIException as e:
+        logger.error("API error during symbol validation: %s", e)
+        raise ValidationError(f"Failed to validate symbol: {e}") from e
+    
+    validate_symbol_pure(symbol, symbol_info)
+    _validated_symbols.add(symbol)
+    return True
+
+def validate_symbols(client: Client, symbols: Iterable[str]) -> Dict[str, bool]:
+    """
+    Check several symbols against one exchangeInfo lookup
+    
+    Unlike validate_symbol this reports rather than raises, so a multi-pair
+    strategy can see every unusable symbol at once.
+    
+    Args:
+        client: Binance client instance
+        symbols: Trading pair symbols
         
-        if symbol not in symbols:
-            raise ValidationError(
-                f"Invalid symbol: {symbol}. Symbol not found on Binance Futures."
-            )
+    Returns:
+        dict: Symbol -> True if it exists and is trading
         
-        # Check if symbol is trading
-        symbol_info = next(s for s in exchange_info['symbols'] if s['symbol'] == symbol)
-        if symbol_info['status'] != 'TRADING':
-            raise ValidationError(
-                f"Symbol {symbol} is not currently trading (status: {symbol_info['status']})"
-            )
+    Raises:
+        ValidationError: If exchangeInfo could not be fetched
+    """
+    try:
+        symbols_by_name = _get_symbols_by_name(client)
+    except BinanceAPIException as e:
+        logger.error("API error during symbol validation: %s", e)
+        raise ValidationError(f"Failed to validate symbols: {e}") from e
+    
+    results = {}
+    for symbol in symbols:
+        symbol_info = symbols_by_name.get(symbol)
+        results[symbol] = symbol_info is not None and symbol_info['status'] == 'TRADING'
+        if results[symbol]:
+            _validated_symbols.add(symbol)
+    return results
+
+def validate_symbol_pure(symbol: str, symbol_info: Optional[Dict[str, Any]]) -> bool:
+    """
+    Validate that symbol exists and is tradeable, given its symbol info
+    
+    Args:
+        symbol: Trading pair symbol
+        symbol_info: Symbol's exchangeInfo entry, or None if it was not listed
         
-        logger.info(f"Symbol validation passed: {symbol}")
-        return True
+    Returns:
+        bool: True if valid
         
-    except BinanceAPIException as e:
-        logger.error(f"API error during symbol validation: {e}")
-        raise ValidationError(f"Failed to validate symbol: {e}")
+    Raises:
+        ValidationError: If symbol is invalid
+    """
+    if symbol_info is None:
+        raise ValidationError(
+            f"Invalid symbol: {symbol}. Symbol not found on Binance Futures."
+        )
+    
+    # Check if symbol is trading
+    if symbol_info['status'] != 'TRADING':
+        raise ValidationError(
+            f"Symbol {symbol} is not currently trading (status: {symbol_info['status']})"
+        )
+    
+    logger.info("Symbol validation passed: %s", symbol)
+    return True
 
 def get_symbol_info(client: Client, symbol: str) -> Dict[str, Any]:
     """
@@ -65,11 +264,7 @@ def get_symbol_info(client: Client, symbol: str) -> Dict[str, Any]:
         dict: Symbol information including filters
     """
     try:
-        exchange_info = client.futures_exchange_info()
-        symbol_info = next(
-            (s for s in exchange_info['symbols'] if s['symbol'] == symbol),
-            None
-        )
+        symbol_info = _get_symbols_by_name(client).get(symbol)
         
         if not symbol_info:
             raise ValidationError(f"Symbol {symbol} not found")
@@ -77,9 +272,82 @@ def get_symbol_info(client: Client, symbol: str) -> Dict[str, Any]:
         return symbol_info
         
     except BinanceAPIException as e:
-        logger.error(f"Failed to get symbol info: {e}")
+        logger.error("Failed to get symbol info: %s", e)
         raise
 
+def parse_symbol_limits(filters: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Parse the limits the validators need out of a symbol's filter list
+    
+    The *_pure validators take the result, e.g.
+    validate_quantity_pure(symbol, parse_symbol_limits(symbol_info['filters']), qty).
+    
+    Args:
+        filters: 'filters' list from the symbol info
+        
+    Returns:
+        dict: min/max quantity and price and min notional as floats, step and
+        tick size as Decimals; None for any limit whose filter is missing
+    """
+    by_type = {f['filterType']: f for f in filters}
+    lot_size = by_type.get('LOT_SIZE')
+    price_filter = by_type.get('PRICE_FILTER')
+    min_notional = by_type.get('MIN_NOTIONAL')
+    
+    limits = dict.fromkeys((
+        'min_qty', 'max_qty', 'step_size',
+        'min_price', 'max_price', 'tick_size', 'min_notional'
+    ))
+    if lot_size:
+        limits['min_qty'] = float(lot_size['minQty'])
+        limits['max_qty'] = float(lot_size['maxQty'])
+        limits['step_size'] = Decimal(lot_size['stepSize'])
+    if price_filter:
+        limits['min_price'] = float(price_filter['minPrice'])
+        limits['max_price'] = float(price_filter['maxPrice'])
+        limits['tick_size'] = Decimal(price_filter['tickSize'])
+    if min_notional:
+        limits['min_notional'] = float(min_notional['notional'])
+    return limits
+
+def get_symbol_limits(client: Client, symbol: str) -> Dict[str, Any]:
+    """
+    Get a symbol's parsed filter limits
+    
+    Args:
+        client: Binance client instance
+        symbol: Trading pair symbol
+        
+    Returns:
+        dict: 'min_qty', 'max_qty', 'min_price', 'max_price' and 'min_notional'
+        as floats, 'step_size' and 'tick_size' as Decimals, None where the
+        symbol lacks the filter; shared, do not modify
+        
+    Raises:
+        ValidationError: If the symbol is not listed
+    """
+    limits = _get_exchange_info_entry(client, EXCHANGE_INFO_TTL)[3].get(symbol)
+    if limits is None:
+        raise ValidationError(f"Symbol {symbol} not found")
+    return limits
+
+@functools.lru_cache(maxsize=1024)
+def _round_down_to_step(value: float, step: Decimal) -> float:
+    """
+    Round a value down to a multiple of a filter's step or tick size
+    
+    Memoized: strategies resubmit the same sizes and prices, and the step
+    is part of the key, so an exchangeInfo refresh needs no invalidation.
+    
+    Args:
+        value: Quantity or price
+        step: Parsed stepSize / tickSize
+        
+    Returns:
+        float: Largest multiple of step not above value
+    """
+    return float((Decimal(str(value)) / step).to_integral_value(ROUND_DOWN) * step)
+
 def validate_quantity(client: Client, symbol: str, quantity: float) -> float:
     """
     Validate and adjust quantity according to symbol filters
@@ -95,45 +363,50 @@ def validate_quantity(client: Client, symbol: str, quantity: float) -> float:
     Raises:
         ValidationError: If quantity is invalid
     """
-    try:
-        symbol_info = get_symbol_info(client, symbol)
-        
-        # Get LOT_SIZE filter
-        lot_size_filter = next(
-            f for f in symbol_info['filters'] if f['filterType'] == 'LOT_SIZE'
-        )
-        
-        min_qty = float(lot_size_filter['minQty'])
-        max_qty = float(lot_size_filter['maxQty'])
-        step_size = float(lot_size_filter['stepSize'])
-        
-        # Validate range
-        if quantity < min_qty:
-            raise ValidationError(
-                f"Quantity {quantity} is below minimum {min_qty} for {symbol}"
-            )
-        
-        if quantity > max_qty:
-            raise ValidationError(
-                f"Quantity {quantity} exceeds maximum {max_qty} for {symbol}"
-            )
-        
-        # Adjust to step size
-        precision = len(str(step_size).rstrip('0').split('.')[-1])
-        adjusted_qty = round(quantity - (quantity % step_size), precision)
-        
-        if adjusted_qty != quantity:
-            logger.warning(
-                f"Quantity adjusted from {quantity} to {adjusted_qty} "
-                f"to match step size {step_size}"
-            )
+    return validate_quantity_pure(symbol, get_symbol_limits(client, symbol), quantity)
+
+def validate_quantity_pure(symbol: str, limits: Dict[str, Any], quantity: float) -> float:
+    """
+    Validate and adjust quantity against a symbol's parsed limits
+    
+    Args:
+        symbol: Trading pair symbol, for messages
+        limits: Limits from get_symbol_limits or parse_symbol_limits
+        quantity: Order quantity
         
-        logger.info(f"Quantity validation passed: {adjusted_qty} {symbol}")
-        return adjusted_qty
+    Returns:
+        float: Validated and adjusted quantity
         
-    except (StopIteration, KeyError) as e:
-        logger.error(f"Failed to validate quantity: {e}")
+    Raises:
+        ValidationError: If quantity is invalid
+    """
+    step_size = limits['step_size']
+    if step_size is None:
+        logger.error("Failed to validate quantity: no LOT_SIZE filter for %s", symbol)
         raise ValidationError(f"Could not find required filters for {symbol}")
+    
+    # Validate range
+    if quantity < limits['min_qty']:
+        raise ValidationError(
+            f"Quantity {quantity} is below minimum {limits['min_qty']} for {symbol}"
+        )
+    
+    if quantity > limits['max_qty']:
+        raise ValidationError(
+            f"Quantity {quantity} exceeds maximum {limits['max_qty']} for {symbol}"
+        )
+    
+    # Adjust to step size
+    adjusted_qty = _round_down_to_step(quantity, step_size)
+    
+    if adjusted_qty != quantity:
+        logger.warning(
+            "Quantity adjusted from %s to %s to match step size %s",
+            quantity, adjusted_qty, float(step_size)
+        )
+    
+    logger.info("Quantity validation passed: %s %s", adjusted_qty, symbol)
+    return adjusted_qty
 
 def validate_price(client: Client, symbol: str, price: float) -> float:
     """
@@ -150,18 +423,51 @@ def validate_price(client: Client, symbol: str, price: float) -> float:
     Raises:
         ValidationError: If price is invalid
     """
-    try:
-        symbol_info = get_symbol_info(client, symbol)
+    return validate_prices(client, symbol, (price,))[0]
+
+def validate_prices(client: Client, symbol: str, prices: Tuple[float, ...]) -> Tuple[float, ...]:
+    """
+    Validate and adjust several prices for one symbol with a single filter lookup
+    
+    Args:
+        client: Binance client instance
+        symbol: Trading pair symbol
+        prices: Order prices
         
-        # Get PRICE_FILTER
-        price_filter = next(
-            f for f in symbol_info['filters'] if f['filterType'] == 'PRICE_FILTER'
-        )
+    Returns:
+        tuple: Validated and adjusted prices, in the same order
+        
+    Raises:
+        ValidationError: If any price is invalid
+    """
+    return validate_prices_pure(symbol, get_symbol_limits(client, symbol), prices)
+
+def validate_prices_pure(symbol: str, limits: Dict[str, Any],
+                        prices: Tuple[float, ...]) -> Tuple[float, ...]:
+    """
+    Validate and adjust prices against a symbol's parsed limits
+    
+    Args:
+        symbol: Trading pair symbol, for messages
+        limits: Limits from get_symbol_limits or parse_symbol_limits
+        prices: Order prices
         
-        min_price = float(price_filter['minPrice'])
-        max_price = float(price_filter['maxPrice'])
-        tick_size = float(price_filter['tickSize'])
+    Returns:
+        tuple: Validated and adjusted prices, in the same order
         
+    Raises:
+        ValidationError: If any price is invalid
+    """
+    tick_size = limits['tick_size']
+    if tick_size is None:
+        logger.error("Failed to validate price: no PRICE_FILTER for %s", symbol)
+        raise ValidationError(f"Could not find required filters for {symbol}")
+    
+    min_price = limits['min_price']
+    max_price = limits['max_price']
+    
+    adjusted_prices = []
+    for price in prices:
         # Validate range
         if price < min_price:
             raise ValidationError(
@@ -174,21 +480,55 @@ def validate_price(client: Client, symbol: str, price: float) -> float:
             )
         
         # Adjust to tick size
-        precision = len(str(tick_size).rstrip('0').split('.')[-1])
-        adjusted_price = round(price - (price % tick_size), precision)
+        adjusted_price = _round_down_to_step(price, tick_size)
         
         if adjusted_price != price:
             logger.warning(
-                f"Price adjusted from {price} to {adjusted_price} "
-                f"to match tick size {tick_size}"
+                "Price adjusted from %s to %s to match tick size %s",
+                price, adjusted_price, float(tick_size)
             )
         
-        logger.info(f"Price validation passed: {adjusted_price} for {symbol}")
-        return adjusted_price
+        logger.info("Price validation passed: %s for %s", adjusted_price, symbol)
+        adjusted_prices.append(adjusted_price)
+    
+    return tuple(adjusted_prices)
+
+def validate_order(client: Client, symbol: str, quantity: float,
+                   price: Optional[float] = None) -> Tuple[float, Optional[float]]:
+    """
+    Validate symbol, quantity and, for priced orders, price and notional value
+    
+    Equivalent to calling validate_symbol, validate_quantity, validate_price and
+    validate_notional in turn, but looks the symbol up only once.
+    
+    Args:
+        client: Binance client instance
+        symbol: Trading pair symbol
+        quantity: Order quantity
+        price: Order price, or None for market orders
+        
+    Returns:
+        tuple: (adjusted quantity, adjusted price or None)
         
-    except (StopIteration, KeyError) as e:
-        logger.error(f"Failed to validate price: {e}")
-        raise ValidationError(f"Could not find required filters for {symbol}")
+    Raises:
+        ValidationError: If any check fails
+    """
+    try:
+        entry = _get_exchange_info_entry(client, EXCHANGE_INFO_TTL)
+    except BinanceAPIException as e:
+        logger.error("API error during symbol validation: %s", e)
+        raise ValidationError(f"Failed to validate symbol: {e}") from e
+    
+    validate_symbol_pure(symbol, entry[2].get(symbol))
+    _validated_symbols.add(symbol)
+    limits = entry[3][symbol]
+    
+    quantity = validate_quantity_pure(symbol, limits, quantity)
+    if price is not None:
+        price = validate_prices_pure(symbol, limits, (price,))[0]
+        validate_min_notional_pure(symbol, limits, quantity, (price,))
+    
+    return quantity, price
 
 def validate_side(side: str) -> str:
     """
@@ -204,7 +544,7 @@ def validate_side(side: str) -> str:
         ValidationError: If side is invalid
     """
     side = side.upper()
-    if side not in ['BUY', 'SELL']:
+    if side not in _VALID_SIDES:
         raise ValidationError(
             f"Invalid side: {side}. Must be 'BUY' or 'SELL'"
         )
@@ -214,6 +554,8 @@ def get_current_price(client: Client, symbol: str) -> float:
     """
     Get current market price for a symbol
     
+    A price fetched less than PRICE_TTL seconds ago is reused.
+    
     Args:
         client: Binance client instance
         symbol: Trading pair symbol
@@ -221,20 +563,29 @@ def get_current_price(client: Client, symbol: str) -> float:
     Returns:
         float: Current market price
     """
+    now = time.monotonic()
+    cached = _price_cache.get((client, symbol))
+    if cached and now - cached[0] < PRICE_TTL:
+        return cached[1]
+    
     try:
         ticker = client.futures_symbol_ticker(symbol=symbol)
         price = float(ticker['price'])
-        logger.debug(f"Current price for {symbol}: {price}")
+        _price_cache[(client, symbol)] = (now, price)
+        logger.debug("Current price for %s: %s", symbol, price)
         return price
         
     except BinanceAPIException as e:
-        logger.error(f"Failed to get current price: {e}")
+        logger.error("Failed to get current price: %s", e)
         raise
 
 def check_balance(client: Client, asset: str = 'USDT') -> float:
     """
     Check available balance for an asset
     
+    Balances fetched less than BALANCE_TTL seconds ago are reused, for
+    every asset of the account.
+    
     Args:
         client: Binance client instance
         asset: Asset to check (default: 'USDT')
@@ -243,17 +594,62 @@ def check_balance(client: Client, asset: str = 'USDT') -> float:
         float: Available balance
     """
     try:
-        account = client.futures_account()
-        balance = next(
-            (float(b['availableBalance']) for b in account['assets'] if b['asset'] == asset),
-            0.0
-        )
-        logger.info(f"Available {asset} balance: {balance}")
-        return balance
-        
+        assets_by_name = _get_account_assets(client)
     except BinanceAPIException as e:
-        logger.error(f"Failed to check balance: {e}")
+        logger.error("Failed to check balance: %s", e)
         raise
+    
+    asset_info = assets_by_name.get(asset)
+    balance = float(asset_info['availableBalance']) if asset_info else 0.0
+    logger.info("Available %s balance: %s", asset, balance)
+    return balance
+
+def _get_account_assets(client: Client, ttl: float = BALANCE_TTL) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the futures account's assets keyed by name, refetching once stale
+    
+    Args:
+        client: Binance client instance
+        ttl: Seconds a fetched account is reused
+        
+    Returns:
+        dict: Asset name -> account asset entry; shared, do not modify
+    """
+    cached = _account_cache.get(client)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    
+    with _account_lock:
+        # Another thread may have refetched while this one waited
+        now = time.monotonic()
+        cached = _account_cache.get(client)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        
+        account = client.futures_account()
+        assets_by_name = {a['asset']: a for a in account['assets']}
+        _account_cache[client] = (now, assets_by_name)
+    
+    return assets_by_name
+
+# format_order_response layout, built once at import
+_ORDER_TEMPLATE = (
+    "\n" + "=" * 60 + "\n"
+    "Order ID: {orderId}\n"
+    "Symbol: {symbol}\n"
+    "Side: {side}\n"
+    "Type: {type}\n"
+    "Quantity: {origQty}\n"
+    "Price: {price}\n"
+    "Status: {status}\n"
+    "Time: {updateTime}\n"
+    + "=" * 60
+)
+
+class _OrderFields(dict):
+    """Order response view for _ORDER_TEMPLATE; missing fields read as None, price as MARKET"""
+    def __missing__(self, key):
+        return 'MARKET' if key == 'price' else None
 
 def format_order_response(order: Dict[str, Any]) -> str:
     """
@@ -265,44 +661,80 @@ def format_order_response(order: Dict[str, Any]) -> str:
     Returns:
         str: Formatted order information
     """
-    return (
-        f"\n{'='*60}\n"
-        f"Order ID: {order.get('orderId')}\n"
-        f"Symbol: {order.get('symbol')}\n"
-        f"Side: {order.get('side')}\n"
-        f"Type: {order.get('type')}\n"
-        f"Quantity: {order.get('origQty')}\n"
-        f"Price: {order.get('price', 'MARKET')}\n"
-        f"Status: {order.get('status')}\n"
-        f"Time: {order.get('updateTime')}\n"
-        f"{'='*60}"
-    )
+    return _ORDER_TEMPLATE.format_map(_OrderFields(order))
 
-def retry_on_failure(func, max_retries: int = 3, delay: float = 1.0):
+def retry_on_failure(func: Optional[Callable] = None, max_retries: int = 3,
+                     delay: float = 1.0, idempotent: bool = False):
     """
     Retry decorator for API calls
     
+    Rate limits (429/418) and connection failures are retried; these are
+    rejected before Binance acts on the request. Timeouts and server errors
+    (5xx) may come after the request was executed, so they are retried only
+    for idempotent calls: never mark an order placement idempotent. Other
+    API errors, such as an invalid symbol, raise at once. Waits grow exponentially with jitter, up to RETRY_DELAY_CAP, and a
+    Retry-After header from the server takes precedence.
+    
+    Usable bare (@retry_on_failure), with options
+    (@retry_on_failure(max_retries=5)) or as a call (retry_on_failure(func)).
+    
     Args:
         func: Function to retry
         max_retries: Maximum number of retry attempts
-        delay: Delay between retries in seconds
+        delay: Base delay between retries in seconds
+        idempotent: Also retry timeouts and 5xx errors (safe for reads only)
         
     Returns:
-        Function result or raises last exception
+        The wrapped function, or a decorator when func is omitted
     """
+    if func is None:
+        return functools.partial(
+            retry_on_failure, max_retries=max_retries, delay=delay, idempotent=idempotent
+        )
+    
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         for attempt in range(max_retries):
             try:
                 return func(*args, **kwargs)
-            except BinanceAPIException as e:
+            except (BinanceAPIException, RequestsConnectionError, Timeout) as e:
+                if not _is_retriable(e, idempotent):
+                    raise
                 if attempt == max_retries - 1:
-                    logger.error(f"Failed after {max_retries} attempts: {e}")
+                    logger.error("Failed after %s attempts: %s", max_retries, e)
+                    raise
+                
+                wait = _retry_after(e)
+                if wait is None:
+                    wait = min(delay * 2 ** attempt + random.uniform(0, delay), RETRY_DELAY_CAP)
+                elif wait > RETRY_DELAY_CAP:
+                    logger.error("Server asked to wait %.0fs before retrying: %s", wait, e)
                     raise
-                logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying...")
-                time.sleep(delay * (attempt + 1))
+                
+                logger.warning("Attempt %s failed: %s. Retrying in %.2fs...", attempt + 1, e, wait)
+                time.sleep(wait)
         return None
     return wrapper
 
+def _is_retriable(error: Exception, idempotent: bool) -> bool:
+    """Whether a failed call may be repeated without risking a duplicate"""
+    if isinstance(error, BinanceAPIException):
+        status = error.status_code
+        return status in (418, 429) or (idempotent and status >= 500)
+    if isinstance(error, Timeout) and not isinstance(error, ConnectTimeout):
+        return idempotent  # the request may have been received
+    return True  # connection never established
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds from the response's Retry-After header, or None if absent"""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers['Retry-After'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
 def calculate_notional_value(quantity: float, price: float) -> float:
     """
     Calculate notional value of an order
@@ -332,28 +764,59 @@ def validate_notional(client: Client, symbol: str, quantity: float, price: float
     Raises:
         ValidationError: If notional value is too low
     """
-    try:
-        symbol_info = get_symbol_info(client, symbol)
+    return validate_min_notional(client, symbol, quantity, price)
+
+def validate_min_notional(client: Client, symbol: str, quantity: float, *prices: float) -> bool:
+    """
+    Validate that orders of one quantity meet minimum notional value at every price
+    
+    Only the lowest price is checked, since it gives the smallest notional.
+    
+    Args:
+        client: Binance client instance
+        symbol: Trading pair symbol
+        quantity: Order quantity
+        *prices: Order prices
         
-        # Get MIN_NOTIONAL filter
-        min_notional_filter = next(
-            (f for f in symbol_info['filters'] if f['filterType'] == 'MIN_NOTIONAL'),
-            None
-        )
+    Returns:
+        bool: True if valid
         
-        if min_notional_filter:
-            min_notional = float(min_notional_filter['notional'])
-            notional_value = calculate_notional_value(quantity, price)
-            
-            if notional_value < min_notional:
-                raise ValidationError(
-                    f"Order value {notional_value:.2f} USDT is below minimum "
-                    f"{min_notional:.2f} USDT for {symbol}"
-                )
-        
-        logger.info(f"Notional value validation passed for {symbol}")
-        return True
+    Raises:
+        ValidationError: If notional value is too low
+    """
+    return validate_min_notional_pure(
+        symbol, get_symbol_limits(client, symbol), quantity, prices
+    )
+
+def validate_min_notional_pure(symbol: str, limits: Dict[str, Any],
+                               quantity: float, prices: Tuple[float, ...]) -> bool:
+    """
+    Validate minimum notional value at every price against a symbol's parsed limits
+    
+    Args:
+        symbol: Trading pair symbol, for messages
+        limits: Limits from get_symbol_limits or parse_symbol_limits
+        quantity: Order quantity
+        prices: Order prices; only the lowest is checked
+        
+    Returns:
+        bool: True if valid
         
-    except StopIteration:
-        logger.warning(f"No MIN_NOTIONAL filter found for {symbol}")
-        return True
\ No newline at end of file
+    Raises:
+        ValidationError: If notional value is too low
+    """
+    min_notional = limits['min_notional']
+    
+    if min_notional is not None:
+        notional_value = calculate_notional_value(quantity, min(prices))
+        
+        if notional_value < min_notional:
+            raise ValidationError(
+                f"Order value {notional_value:.2f} USDT is below minimum "
+                f"{min_notional:.2f} USDT for {symbol}"
+            )
+    else:
+        logger.warning("No MIN_NOTIONAL filter found for %s", symbol)
+    
+    logger.info("Notional value validation passed for %s", symbol)
+    return True